@@ -27,6 +27,9 @@ Usage:
     # Run this example
     python examples/complete_workflow_example.py
 
+    # Without the request/result bodies
+    OPENHQM_DEMO_VERBOSE=0 python examples/complete_workflow_example.py
+
 Requirements:
     - OpenHQM running on localhost:8000
     - routing-config.yaml loaded
@@ -36,75 +39,235 @@ Requirements:
 import asyncio
 import httpx
 import json
-from typing import Dict, Any, List
-from datetime import datetime
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, Any, List, Optional, Set
+
+try:
+    import orjson  # Optional: faster JSON encode/decode (pip install orjson)
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  Optional: HTTP/2 support for httpx (pip install httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import uvloop  # Optional: faster event loop on Linux/macOS (pip install uvloop)
+except ImportError:
+    uvloop = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialize a JSON body for the wire."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def pretty_json(data: Any) -> str:
+    """Render JSON for display."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def encode_request(
+    payload: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    payload_json: Optional[bytes] = None,
+    metadata_json: Optional[bytes] = None,
+) -> bytes:
+    """
+    Encode a submit body, splicing in parts that were encoded ahead of time.
+
+    Scenarios that send the same payload or metadata several times encode
+    it once and pass the bytes here, so only the varying part is serialized
+    per request.
+    """
+    if payload_json is None:
+        payload_json = encode_json(payload)
+    body = b'{"payload":' + payload_json
+    if metadata_json is None and metadata:
+        metadata_json = encode_json(metadata)
+    if metadata_json is not None:
+        body += b',"metadata":' + metadata_json
+    return body + b"}"
+
+
+class TimestampCache:
+    """UTC ISO-8601 timestamps (second precision), formatted at most once per second."""
+
+    def __init__(self):
+        self._second = -1
+        self._formatted = ""
+
+    def now(self) -> str:
+        second = int(time.time())
+        if second != self._second:
+            self._second = second
+            self._formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        return self._formatted
+
+
+timestamps = TimestampCache()
+
+BASE_URL = "http://localhost:8000"
+
+# Banner lines, built once
+RULE = "=" * 60
+SEPARATOR = "\n" + RULE
+
+# Statuses after which a request will not change any more
+FINAL_STATUSES = {"COMPLETED", "FAILED", "TIMEOUT"}
+
+# Seconds the server may hold a submission to return its result inline
+INLINE_WAIT = 10
+
+# Process-wide HTTP client, reused by every scenario so requests share
+# the same keep-alive connection pool.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client(base_url: str = BASE_URL) -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    When h2 is installed the client negotiates HTTP/2, so concurrent
+    requests are multiplexed over a single connection instead of each
+    needing its own socket.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url=base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _CLIENT
+
+
+# Base URLs whose /health preflight has already succeeded in this process
+_HEALTHY: Set[str] = set()
+
+
+async def check_health(client: httpx.AsyncClient) -> None:
+    """Check that OpenHQM is reachable, at most once per base URL per process."""
+    base_url = str(client.base_url)
+    if base_url not in _HEALTHY:
+        await client.get("/health")
+        _HEALTHY.add(base_url)
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
 
 
 class OpenHQMWorkflowDemo:
     """Demonstrates complete OpenHQM workflow."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, verbose: Optional[bool] = None):
+        self.client = client or get_client()
+        self.base_url = str(self.client.base_url).rstrip("/")
+        # Pretty-printed request/result bodies; OPENHQM_DEMO_VERBOSE=0 turns them off
+        if verbose is None:
+            verbose = os.getenv("OPENHQM_DEMO_VERBOSE", "1") != "0"
+        self.verbose = verbose
         self.results: List[Dict[str, Any]] = []
+        self.status_counts: Counter = Counter()
 
     async def submit_and_track(
         self,
         name: str,
         payload: Dict[str, Any],
         metadata: Dict[str, Any] = None,
-        expected_route: str = None
+        expected_route: str = None,
+        track: bool = False,
+        payload_json: Optional[bytes] = None,
+        metadata_json: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        """Submit request and track it through the system."""
-        print(f"\n{'='*60}")
-        print(f"📤 Submitting: {name}")
-        print(f"{'='*60}")
+        """
+        Submit request and track it through the system.
 
-        request_data = {"payload": payload}
-        if metadata:
-            request_data["metadata"] = metadata
+        By default the server is asked to return the result inline with the
+        submission (one round-trip). With ``track=True`` the request is
+        submitted asynchronously and its result polled separately.
 
-        print(f"📋 Request data:")
-        print(json.dumps(request_data, indent=2))
+        ``payload_json`` and ``metadata_json`` are the already-encoded
+        ``payload`` and ``metadata``, for bodies sent more than once.
+        """
+        out = [SEPARATOR, f"📤 Submitting: {name}", RULE]
+
+        if self.verbose:
+            request_data = {"payload": payload}
+            if metadata:
+                request_data["metadata"] = metadata
+            out.append("📋 Request data:")
+            out.append(pretty_json(request_data))
 
         try:
             # Submit request
             response = await self.client.post(
-                f"{self.base_url}/api/v1/submit",
-                json=request_data
+                "/api/v1/submit",
+                params=None if track else {"wait": INLINE_WAIT},
+                content=encode_request(payload, metadata, payload_json, metadata_json),
+                headers=JSON_HEADERS,
             )
             response.raise_for_status()
-            result = response.json()
+            result = decode_json(response.content)
             correlation_id = result["correlation_id"]
 
-            print(f"✅ Submitted successfully")
-            print(f"🔑 Correlation ID: {correlation_id}")
+            out.append("✅ Submitted successfully")
+            out.append(f"🔑 Correlation ID: {correlation_id}")
 
             if expected_route:
-                print(f"🎯 Expected route: {expected_route}")
-
-            # Wait for processing
-            await asyncio.sleep(1)
+                out.append(f"🎯 Expected route: {expected_route}")
 
-            # Check status
-            final_response = await self.get_response(correlation_id)
+            # Wait for processing unless the result came back inline
+            if result.get("status") in FINAL_STATUSES:
+                final_response = result
+            else:
+                final_response = await self.wait_for_completion(correlation_id)
             status = final_response.get("status", "UNKNOWN")
 
-            print(f"📊 Status: {status}")
+            out.append(f"📊 Status: {status}")
 
             if status == "COMPLETED":
-                print(f"✅ Processing completed")
-                if "result" in final_response:
-                    print(f"📦 Result:")
-                    print(json.dumps(final_response["result"], indent=2))
+                out.append("✅ Processing completed")
+                if self.verbose and "result" in final_response:
+                    out.append("📦 Result:")
+                    out.append(pretty_json(final_response["result"]))
             elif status == "FAILED":
-                print(f"❌ Processing failed")
+                out.append("❌ Processing failed")
                 if "error" in final_response:
-                    print(f"⚠️  Error: {final_response['error']}")
+                    out.append(f"⚠️  Error: {final_response['error']}")
             else:
-                print(f"⏳ Still processing...")
+                out.append("⏳ Still processing...")
 
             # Store result
+            self.status_counts[status] += 1
             self.results.append({
                 "name": name,
                 "correlation_id": correlation_id,
@@ -116,19 +279,41 @@ class OpenHQMWorkflowDemo:
             return final_response
 
         except httpx.HTTPError as e:
-            print(f"❌ HTTP Error: {e}")
+            out.append(f"❌ HTTP Error: {e}")
             return {"status": "ERROR", "error": str(e)}
         except Exception as e:
-            print(f"❌ Error: {e}")
+            out.append(f"❌ Error: {e}")
             return {"status": "ERROR", "error": str(e)}
-
-    async def get_response(self, correlation_id: str) -> Dict[str, Any]:
-        """Get request response."""
-        response = await self.client.get(
-            f"{self.base_url}/api/v1/response/{correlation_id}"
-        )
+        finally:
+            # One write per request keeps concurrent requests' output apart
+            sys.stdout.write("\n".join(out) + "\n")
+
+    async def get_response(self, correlation_id: str, wait: float = 0) -> Dict[str, Any]:
+        """Get request response, letting the server hold the call up to ``wait`` seconds."""
+        params = {"wait": wait} if wait > 0 else None
+        response = await self.client.get(f"/api/v1/response/{correlation_id}", params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response.content)
+
+    async def wait_for_completion(
+        self, correlation_id: str, max_wait: float = 10.0, long_poll: float = 5.0
+    ) -> Dict[str, Any]:
+        """Long-poll with exponential backoff; returns the last response on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = 0.025
+
+        while True:
+            remaining = deadline - loop.time()
+            response = await self.get_response(
+                correlation_id, wait=max(0.0, min(long_poll, remaining))
+            )
+            remaining = deadline - loop.time()
+            if response.get("status") in FINAL_STATUSES or remaining <= 0:
+                return response
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 1.0)
 
     async def scenario_1_user_registration(self):
         """Scenario 1: User Registration with JQ Transformation."""
@@ -150,7 +335,7 @@ class OpenHQMWorkflowDemo:
             metadata={
                 "type": "user.register",
                 "source": "web-app",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamps.now()
             },
             expected_route="user-registration"
         )
@@ -203,24 +388,33 @@ class OpenHQMWorkflowDemo:
         # Test multiple notification types
         notification_types = ["email", "sms", "push"]
 
-        for notif_type in notification_types:
-            await self.submit_and_track(
+        # Same notification for every channel; only the metadata varies
+        payload = {
+            "user": {
+                "email": "user@example.com",
+                "name": "Test User"
+            },
+            "subject": "Order Confirmation",
+            "message": "Your order has been confirmed and will ship soon.",
+            "priority": "normal"
+        }
+
+        payload_json = encode_json(payload)
+
+        # Notifications are independent, so submit them concurrently
+        await asyncio.gather(*(
+            self.submit_and_track(
                 name=f"Notification - {notif_type.upper()}",
-                payload={
-                    "user": {
-                        "email": "user@example.com",
-                        "name": "Test User"
-                    },
-                    "subject": "Order Confirmation",
-                    "message": "Your order has been confirmed and will ship soon.",
-                    "priority": "normal"
-                },
+                payload=payload,
+                payload_json=payload_json,
                 metadata={
                     "type": f"notification.{notif_type}",
                     "template": "order-confirmation"
                 },
                 expected_route="notification"
             )
+            for notif_type in notification_types
+        ))
 
     async def scenario_4_analytics(self):
         """Scenario 4: Analytics Event Tracking."""
@@ -238,7 +432,7 @@ class OpenHQMWorkflowDemo:
                     "type": "page_view",
                     "user_id": "user-789",
                     "page": "/products/laptop",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamps.now(),
                     "properties": {
                         "referrer": "google.com",
                         "device": "desktop",
@@ -264,24 +458,32 @@ class OpenHQMWorkflowDemo:
         print("Expected: Session ID preserved, routed to same partition")
 
         session_id = "sess-legacy-123"
-
-        # Submit multiple requests with same session ID
-        for i in range(3):
-            await self.submit_and_track(
+        metadata = {
+            "type": "legacy.request",
+            "session_id": session_id,
+            "user_id": "legacy-user-456"
+        }
+        metadata_json = encode_json(metadata)
+
+        def legacy_request(i: int):
+            return self.submit_and_track(
                 name=f"Legacy Request {i+1}",
                 payload={
                     "action": "get_user_cart" if i == 0 else "update_cart",
                     "user_id": "legacy-user-456",
                     "data": {"item": f"ITEM-00{i+1}", "quantity": i+1}
                 },
-                metadata={
-                    "type": "legacy.request",
-                    "session_id": session_id,
-                    "user_id": "legacy-user-456"
-                },
-                expected_route="legacy-app-session"
+                metadata=metadata,
+                metadata_json=metadata_json,
+                expected_route="legacy-app-session",
+                track=True
             )
 
+        # Submit multiple requests with same session ID: the cart must be
+        # loaded first, the updates that follow can go out together
+        await legacy_request(0)
+        await asyncio.gather(*(legacy_request(i) for i in range(1, 3)))
+
     async def scenario_6_payment_processing(self):
         """Scenario 6: Payment Processing with Query Parameters."""
         print("\n" + "="*60)
@@ -338,9 +540,9 @@ class OpenHQMWorkflowDemo:
         print("="*60)
 
         total = len(self.results)
-        completed = sum(1 for r in self.results if r["status"] == "COMPLETED")
-        failed = sum(1 for r in self.results if r["status"] == "FAILED")
-        pending = sum(1 for r in self.results if r["status"] == "PENDING")
+        completed = self.status_counts["COMPLETED"]
+        failed = self.status_counts["FAILED"]
+        pending = self.status_counts["PENDING"]
 
         print(f"\nTotal Requests: {total}")
         print(f"✅ Completed: {completed}")
@@ -365,7 +567,7 @@ class OpenHQMWorkflowDemo:
 
         try:
             # Check if OpenHQM is running
-            await self.client.get(f"{self.base_url}/health")
+            await check_health(self.client)
             print("✅ OpenHQM is running")
         except:
             print("❌ Error: OpenHQM is not running on", self.base_url)
@@ -387,14 +589,16 @@ class OpenHQMWorkflowDemo:
         # Print summary
         await self.print_summary()
 
-        await self.client.aclose()
-
 
 async def main():
     """Main entry point."""
-    demo = OpenHQMWorkflowDemo()
-    await demo.run_all_scenarios()
+    try:
+        demo = OpenHQMWorkflowDemo()
+        await demo.run_all_scenarios()
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main())
@@ -9,15 +9,115 @@ as a reverse proxy to forward requests to backend endpoints.
 import asyncio
 import httpx
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson  # Optional: faster JSON encode/decode (pip install orjson)
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  Optional: HTTP/2 support for httpx (pip install httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import uvloop  # Optional: faster event loop on Linux/macOS (pip install uvloop)
+except ImportError:
+    uvloop = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialize a JSON body for the wire."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def pretty_json(data: Any) -> str:
+    """Render JSON for display."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+BASE_URL = "http://localhost:8000"
+
+# Statuses after which a request will not change any more
+FINAL_STATUSES = {"COMPLETED", "FAILED", "TIMEOUT"}
+
+# Most requests the server accepts in one submit-batch / responses call
+MAX_BATCH_SIZE = 100
+
+# Batches run_batch keeps in flight at once
+MAX_CONCURRENT_BATCHES = 4
+
+# Largest response body the client will read (matches the proxy's default limit)
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+# Process-wide HTTP client, shared by every OpenHQMClient so that all
+# examples reuse the same keep-alive connection pool.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client(base_url: str = BASE_URL) -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    When h2 is installed the client negotiates HTTP/2, so concurrent
+    requests are multiplexed over a single connection instead of each
+    needing its own socket.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url=base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
 
 
 class OpenHQMClient:
     """Simple client for interacting with OpenHQM API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client or get_client()
+        self._owns_client = client is None
+
+    async def __aenter__(self) -> "OpenHQMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP client, unless one was passed in."""
+        if self._owns_client:
+            await close_client()
 
     async def submit_request(
         self,
@@ -38,220 +138,334 @@ class OpenHQMClient:
         Returns:
             Correlation ID for tracking
         """
-        request_data = {"payload": payload}
+        result = await self._submit(payload, headers, endpoint, timeout)
+        return result["correlation_id"]
 
+    async def submit_sync(
+        self,
+        payload: Dict[str, Any],
+        *,
+        headers: Dict[str, str] = None,
+        endpoint: str = None,
+        timeout: int = 300,
+        max_wait: float = 60,
+    ) -> Dict[str, Any]:
+        """
+        Submit a request and wait for its final response.
+
+        The server holds the submission open for up to ``max_wait`` seconds
+        (capped at 30) and returns the result inline when it is ready in
+        time; otherwise the request is polled until it completes.
+
+        Args:
+            payload: Request payload to forward to backend
+            headers: Headers to forward to backend
+            endpoint: Named endpoint to use
+            timeout: Request timeout in seconds
+            max_wait: Maximum wait time in seconds
+
+        Returns:
+            Final response
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+
+        result = await self._submit(payload, headers, endpoint, timeout, wait=min(max_wait, 30))
+        if result["status"] in FINAL_STATUSES:
+            return result
+
+        return await self.wait_for_completion(
+            result["correlation_id"], max_wait=max(0.0, deadline - loop.time())
+        )
+
+    async def _submit(
+        self,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+        endpoint: Optional[str],
+        timeout: int,
+        wait: float = 0,
+    ) -> Dict[str, Any]:
+        """POST a request to /api/v1/submit and return the decoded response."""
+        request_data = {"payload": payload}
         if headers:
             request_data["headers"] = headers
 
-        if endpoint or timeout != 300:
-            request_data["metadata"] = {}
-            if endpoint:
-                request_data["metadata"]["endpoint"] = endpoint
-            if timeout != 300:
-                request_data["metadata"]["timeout"] = timeout
+        metadata = {}
+        if endpoint:
+            metadata["endpoint"] = endpoint
+        if timeout != 300:
+            metadata["timeout"] = timeout
+        if metadata:
+            request_data["metadata"] = metadata
 
         response = await self.client.post(
-            f"{self.base_url}/api/v1/submit",
-            json=request_data,
-            headers={"Content-Type": "application/json"},
+            "/api/v1/submit",
+            params={"wait": wait} if wait > 0 else None,
+            content=encode_json(request_data),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
+        return decode_json(response.content)
 
-        result = response.json()
-        return result["correlation_id"]
+    async def submit_batch(self, payloads: List[Dict[str, Any]]) -> List[str]:
+        """
+        Submit several requests to OpenHQM in a single call.
 
-    async def get_status(self, correlation_id: str) -> Dict[str, Any]:
-        """Get request status."""
-        response = await self.client.get(
-            f"{self.base_url}/api/v1/status/{correlation_id}"
-        )
-        response.raise_for_status()
-        return response.json()
+        Args:
+            payloads: Request payloads (at most 100)
 
-    async def get_response(self, correlation_id: str) -> Dict[str, Any]:
-        """Get request response."""
-        response = await self.client.get(
-            f"{self.base_url}/api/v1/response/{correlation_id}"
+        Returns:
+            Correlation IDs, in the same order as the payloads
+        """
+        response = await self.client.post(
+            "/api/v1/submit-batch",
+            content=encode_json({"items": [{"payload": payload} for payload in payloads]}),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
-        return response.json()
+        return [item["correlation_id"] for item in decode_json(response.content)["items"]]
 
-    async def wait_for_completion(
-        self, correlation_id: str, max_wait: int = 60, poll_interval: float = 1.0
-    ) -> Dict[str, Any]:
+    async def run_batch(
+        self,
+        payloads: List[Dict[str, Any]],
+        max_wait: float = 60,
+        concurrency: int = MAX_CONCURRENT_BATCHES,
+    ) -> List[Dict[str, Any]]:
         """
-        Poll until request completes or times out.
+        Submit any number of requests and wait for all of them to finish.
+
+        Payloads are split into server-sized batches, and at most
+        ``concurrency`` batches are submitted and polled at a time, so the
+        number of requests in flight stays bounded however many there are.
 
         Args:
-            correlation_id: Request correlation ID
-            max_wait: Maximum wait time in seconds
-            poll_interval: Time between polls in seconds
+            payloads: Request payloads
+            max_wait: Maximum wait time per batch in seconds
+            concurrency: Maximum number of batches in flight
 
         Returns:
-            Final response
+            Final responses, in the same order as the payloads
         """
-        elapsed = 0
-        while elapsed < max_wait:
-            response = await self.get_response(correlation_id)
-            status = response["status"]
+        semaphore = asyncio.Semaphore(concurrency)
 
-            if status in ["COMPLETED", "FAILED"]:
-                return response
+        async def run_one(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                correlation_ids = await self.submit_batch(chunk)
+                return await self.wait_for_all(correlation_ids, max_wait=max_wait)
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(run_one(payloads[start:start + MAX_BATCH_SIZE]))
+                for start in range(0, len(payloads), MAX_BATCH_SIZE)
+            ]
+        return [response for task in tasks for response in task.result()]
 
-        raise TimeoutError(f"Request did not complete within {max_wait} seconds")
+    async def get_responses(self, correlation_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the responses of several requests in a single call.
 
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        Args:
+            correlation_ids: Request correlation IDs (at most 100)
 
+        Returns:
+            Current response of each known request
+        """
+        body = await self._get_json("/api/v1/responses", params={"ids": ",".join(correlation_ids)})
+        return body["items"]
 
-async def example_basic_request():
-    """Example: Submit a basic request to default endpoint."""
-    print("\n=== Example 1: Basic Request ===")
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a JSON document, streaming the body with a size cap.
 
-    client = OpenHQMClient()
+        The body is read chunk by chunk and decoded straight from bytes, so
+        a large result is held in memory once and an oversized one is
+        rejected before it is fully downloaded.
+        """
+        async with self.client.stream("GET", url, params=params) as response:
+            response.raise_for_status()
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise ValueError(f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes")
+        return decode_json(body)
 
-    try:
-        # Submit request
-        print("Submitting request...")
-        correlation_id = await client.submit_request(
-            payload={"operation": "process", "data": "Hello World"}
-        )
-        print(f"Correlation ID: {correlation_id}")
+    async def get_status(self, correlation_id: str) -> Dict[str, Any]:
+        """Get request status."""
+        return await self._get_json(f"/api/v1/status/{correlation_id}")
 
-        # Wait for completion
-        print("Waiting for response...")
-        response = await client.wait_for_completion(correlation_id)
+    async def get_response(self, correlation_id: str, wait: float = 0) -> Dict[str, Any]:
+        """
+        Get request response.
 
-        print(f"Status: {response['status']}")
-        print(f"Status Code: {response.get('status_code')}")
-        print(f"Result: {json.dumps(response['result'], indent=2)}")
+        Args:
+            correlation_id: Request correlation ID
+            wait: Seconds the server may hold the request waiting for completion
 
-    finally:
-        await client.close()
+        Returns:
+            Current response
+        """
+        params = {"wait": wait} if wait > 0 else None
+        return await self._get_json(f"/api/v1/response/{correlation_id}", params=params)
 
+    async def wait_for_completion(
+        self, correlation_id: str, max_wait: float = 60, long_poll: float = 5.0
+    ) -> Dict[str, Any]:
+        """
+        Wait until request completes or times out.
 
-async def example_with_headers():
-    """Example: Forward headers to backend."""
-    print("\n=== Example 2: Request with Headers ===")
+        Each poll is a server-side long-poll of up to ``long_poll`` seconds;
+        between polls the client backs off exponentially from 25ms to 1s.
 
-    client = OpenHQMClient()
+        Args:
+            correlation_id: Request correlation ID
+            max_wait: Maximum wait time in seconds
+            long_poll: Maximum time the server may hold each poll
 
-    try:
-        # Submit request with custom headers
-        print("Submitting request with headers...")
-        correlation_id = await client.submit_request(
-            payload={"action": "authenticate", "user_id": "12345"},
-            headers={
-                "Authorization": "Bearer client-token-xyz",
-                "X-Request-ID": "req-abc-123",
-                "X-Client-Version": "1.0.0",
-            },
-        )
-        print(f"Correlation ID: {correlation_id}")
+        Returns:
+            Final response
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = 0.025
+
+        while True:
+            remaining = deadline - loop.time()
+            response = await self.get_response(
+                correlation_id, wait=max(0.0, min(long_poll, remaining))
+            )
+            if response["status"] in FINAL_STATUSES:
+                return response
 
-        # Wait for completion
-        print("Waiting for response...")
-        response = await client.wait_for_completion(correlation_id)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Request did not complete within {max_wait} seconds")
 
-        print(f"Status: {response['status']}")
-        print(f"Result: {json.dumps(response['result'], indent=2)}")
-        print(f"Response Headers: {json.dumps(response.get('headers', {}), indent=2)}")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 1.0)
 
-    finally:
-        await client.close()
+    async def wait_for_all(
+        self, correlation_ids: List[str], max_wait: float = 60
+    ) -> List[Dict[str, Any]]:
+        """
+        Wait until all requests complete, polling them together.
 
+        Args:
+            correlation_ids: Request correlation IDs (at most 100)
+            max_wait: Maximum wait time in seconds
 
-async def example_multiple_endpoints():
-    """Example: Route requests to different endpoints."""
-    print("\n=== Example 3: Multiple Endpoints ===")
+        Returns:
+            Final responses, in the same order as the correlation IDs
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = 0.025
+        done: Dict[str, Dict[str, Any]] = {}
+        pending = list(correlation_ids)
+
+        while True:
+            for response in await self.get_responses(pending):
+                if response["status"] in FINAL_STATUSES:
+                    done[response["correlation_id"]] = response
+            pending = [cid for cid in pending if cid not in done]
+            if not pending:
+                return [done[cid] for cid in correlation_ids]
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{len(pending)} requests did not complete within {max_wait} seconds"
+                )
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.7, 1.0)
+
+
+async def example_basic_request(client: OpenHQMClient):
+    """Example: Submit a basic request to default endpoint."""
+    print("\n=== Example 1: Basic Request ===")
 
-    client = OpenHQMClient()
+    # Submit request and wait for its response
+    print("Submitting request...")
+    response = await client.submit_sync(
+        payload={"operation": "process", "data": "Hello World"}
+    )
+    print(f"Correlation ID: {response['correlation_id']}")
 
-    try:
-        # Request to user service
-        print("Request to user-service...")
-        user_id = await client.submit_request(
-            payload={"action": "get_user", "user_id": "12345"},
-            endpoint="user-service",
-        )
+    print(f"Status: {response['status']}")
+    print(f"Status Code: {response.get('status_code')}")
+    print(f"Result: {pretty_json(response['result'])}")
 
-        # Request to order service
-        print("Request to order-service...")
-        order_id = await client.submit_request(
-            payload={"action": "create_order", "items": ["item1", "item2"]},
-            endpoint="order-service",
-        )
 
-        # Request to analytics service
-        print("Request to analytics-service...")
-        analytics_id = await client.submit_request(
-            payload={"event": "page_view", "page": "/home"},
-            endpoint="analytics-service",
-        )
+async def example_with_headers(client: OpenHQMClient):
+    """Example: Forward headers to backend."""
+    print("\n=== Example 2: Request with Headers ===")
 
-        # Wait for all to complete
-        print("\nWaiting for all responses...")
-        user_response = await client.wait_for_completion(user_id)
-        order_response = await client.wait_for_completion(order_id)
-        analytics_response = await client.wait_for_completion(analytics_id)
+    # Submit request with custom headers and wait for its response
+    print("Submitting request with headers...")
+    response = await client.submit_sync(
+        payload={"action": "authenticate", "user_id": "12345"},
+        headers={
+            "Authorization": "Bearer client-token-xyz",
+            "X-Request-ID": "req-abc-123",
+            "X-Client-Version": "1.0.0",
+        },
+    )
+    print(f"Correlation ID: {response['correlation_id']}")
 
-        print("\n--- User Service Response ---")
-        print(f"Status: {user_response['status']}")
-        print(f"Result: {json.dumps(user_response['result'], indent=2)}")
+    print(f"Status: {response['status']}")
+    print(f"Result: {pretty_json(response['result'])}")
+    print(f"Response Headers: {pretty_json(response.get('headers', {}))}")
 
-        print("\n--- Order Service Response ---")
-        print(f"Status: {order_response['status']}")
-        print(f"Result: {json.dumps(order_response['result'], indent=2)}")
 
-        print("\n--- Analytics Service Response ---")
-        print(f"Status: {analytics_response['status']}")
-        print(f"Result: {json.dumps(analytics_response['result'], indent=2)}")
+async def example_multiple_endpoints(client: OpenHQMClient):
+    """Example: Route requests to different endpoints."""
+    print("\n=== Example 3: Multiple Endpoints ===")
 
-    finally:
-        await client.close()
+    requests = [
+        ("User Service", "user-service", {"action": "get_user", "user_id": "12345"}),
+        ("Order Service", "order-service", {"action": "create_order", "items": ["item1", "item2"]}),
+        ("Analytics Service", "analytics-service", {"event": "page_view", "page": "/home"}),
+    ]
+
+    async def call(name: str, endpoint: str, payload: Dict[str, Any]):
+        print(f"  Request to {endpoint}")
+        return name, await client.submit_sync(payload=payload, endpoint=endpoint)
+
+    print("Submitting requests and waiting for responses...")
+    # Report each response as soon as it arrives rather than in submission order
+    for next_done in asyncio.as_completed([call(*request) for request in requests]):
+        name, response = await next_done
+        print(f"\n--- {name} Response ---")
+        print(f"Status: {response['status']}")
+        print(f"Result: {pretty_json(response['result'])}")
 
 
-async def example_batch_requests():
+async def example_batch_requests(client: OpenHQMClient):
     """Example: Submit multiple requests in batch."""
     print("\n=== Example 4: Batch Requests ===")
 
-    client = OpenHQMClient()
-
-    try:
-        # Submit batch of requests
-        print("Submitting batch of 10 requests...")
-        correlation_ids = []
-
-        for i in range(10):
-            correlation_id = await client.submit_request(
-                payload={"batch_id": i, "data": f"Request {i}"}
-            )
-            correlation_ids.append(correlation_id)
-            print(f"  [{i+1}/10] Submitted: {correlation_id}")
-
-        # Wait for all to complete
-        print("\nWaiting for all responses...")
-        results = []
-        for i, correlation_id in enumerate(correlation_ids):
-            response = await client.wait_for_completion(correlation_id, max_wait=120)
-            results.append(response)
-            print(f"  [{i+1}/10] Completed: {response['status']}")
+    batch_size = 10
 
-        # Summary
-        completed = sum(1 for r in results if r["status"] == "COMPLETED")
-        failed = sum(1 for r in results if r["status"] == "FAILED")
+    # Submit in server-sized batches and poll each batch together until it
+    # finishes; raise batch_size to stress-test with bounded concurrency
+    print(f"Submitting batch of {batch_size} requests...")
+    results = await client.run_batch(
+        [{"batch_id": i, "data": f"Request {i}"} for i in range(batch_size)],
+        max_wait=120,
+    )
+    for i, response in enumerate(results):
+        print(f"  [{i+1}/{batch_size}] {response['correlation_id']}: {response['status']}")
 
-        print(f"\nBatch Summary:")
-        print(f"  Total: {len(results)}")
-        print(f"  Completed: {completed}")
-        print(f"  Failed: {failed}")
+    # Summary
+    completed = sum(1 for r in results if r["status"] == "COMPLETED")
+    failed = sum(1 for r in results if r["status"] == "FAILED")
 
-    finally:
-        await client.close()
+    print(f"\nBatch Summary:")
+    print(f"  Total: {len(results)}")
+    print(f"  Completed: {completed}")
+    print(f"  Failed: {failed}")
 
 
 async def main():
@@ -260,18 +474,20 @@ async def main():
     print("=" * 60)
 
     try:
-        await example_basic_request()
-        await example_with_headers()
-        # Uncomment to run additional examples:
-        # await example_multiple_endpoints()
-        # await example_batch_requests()
+        async with OpenHQMClient() as client:
+            await example_basic_request(client)
+            await example_with_headers(client)
+            # Uncomment to run additional examples:
+            # await example_multiple_endpoints(client)
+            # await example_batch_requests(client)
 
     except httpx.HTTPError as e:
         print(f"\nHTTP Error: {e}")
-        print("Make sure OpenHQM is running on http://localhost:8000")
+        print(f"Make sure OpenHQM is running on {BASE_URL}")
     except Exception as e:
         print(f"\nError: {e}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(main())
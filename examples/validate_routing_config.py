@@ -22,13 +22,41 @@ Exit codes:
     2 - File not found or invalid YAML
 """
 
+import os
 import sys
-import yaml
 import re
-import json
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+# yaml, json and concurrent.futures are imported where they are used, so a
+# usage error exits without paying for them
+
+# Patterns used for every route, compiled once
+ROUTE_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+TEMPLATE_VAR_RE = re.compile(r'\{\{([^}]+)\}\}')
+TEMPLATE_VAR_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_.]*$')
+HEADER_NAME_RE = re.compile(r'^[A-Za-z0-9-]+$')
+
+# Allowed values for a route's method and transform_type
+VALID_METHODS = frozenset({'GET', 'POST', 'PUT', 'PATCH', 'DELETE'})
+VALID_TRANSFORM_TYPES = frozenset({'jq', 'template', 'jsonpath', 'passthrough'})
+
+# Characters a JSON document can start with; JQ expressions starting with
+# anything else ('.', '|', '(', ...) cannot be static JSON
+JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# Configs with at least this many routes are validated across CPU cores;
+# below it, starting worker processes costs more than it saves
+PARALLEL_MIN_ROUTES = 20000
+
+
+@lru_cache(maxsize=1024)
+def compile_match_pattern(pattern: str) -> re.Pattern:
+    """Compile a route's match_pattern, once per distinct pattern."""
+    return re.compile(pattern)
+
 
 class ConfigValidator:
     """Validates OpenHQM routing configuration."""
@@ -72,13 +100,23 @@ class ConfigValidator:
             self.warnings.append("No routes defined")
             return
 
+        # Routes are independent, so large configs are checked in parallel
+        route_ids = [f"routes[{idx}]" for idx in range(len(routes))]
+        if len(routes) >= PARALLEL_MIN_ROUTES and (os.cpu_count() or 1) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(validate_route, routes, route_ids, chunksize=64))
+        else:
+            results = map(validate_route, routes, route_ids)
+
         # Track route names and priorities
         route_names = set()
         priorities = {}
 
-        for idx, route in enumerate(routes):
-            route_id = f"routes[{idx}]"
-            self._validate_route(route, route_id)
+        for route_id, route, (errors, warnings) in zip(route_ids, routes, results):
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
 
             # Check for duplicate names
             name = route.get('name')
@@ -109,7 +147,7 @@ class ConfigValidator:
             name = route['name']
             if not isinstance(name, str) or not name.strip():
                 self.errors.append(f"{route_id}: Invalid route name")
-            elif not re.match(r'^[a-z0-9-]+$', name):
+            elif not ROUTE_NAME_RE.match(name):
                 self.warnings.append(
                     f"{route_id}: Route name '{name}' should use lowercase "
                     "alphanumeric and hyphens only"
@@ -130,11 +168,10 @@ class ConfigValidator:
         # Validate method
         if 'method' in route:
             method = route['method']
-            valid_methods = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
-            if method not in valid_methods:
+            if not isinstance(method, str) or method not in VALID_METHODS:
                 self.errors.append(
                     f"{route_id}: Invalid HTTP method '{method}', "
-                    f"must be one of {valid_methods}"
+                    f"must be one of {sorted(VALID_METHODS)}"
                 )
 
         # Validate priority
@@ -195,19 +232,20 @@ class ConfigValidator:
         if has_match_pattern:
             pattern = route['match_pattern']
             try:
-                re.compile(pattern)
+                compile_match_pattern(pattern)
+            except TypeError:
+                self.errors.append(f"{route_id}: match_pattern must be a string")
             except re.error as e:
                 self.errors.append(f"{route_id}: Invalid regex pattern: {e}")
 
     def _validate_transform(self, route: Dict[str, Any], route_id: str):
         """Validate transformation configuration."""
         transform_type = route.get('transform_type', 'passthrough')
-        valid_types = ['jq', 'template', 'jsonpath', 'passthrough']
 
-        if transform_type not in valid_types:
+        if not isinstance(transform_type, str) or transform_type not in VALID_TRANSFORM_TYPES:
             self.errors.append(
                 f"{route_id}: Invalid transform_type '{transform_type}', "
-                f"must be one of {valid_types}"
+                f"must be one of {sorted(VALID_TRANSFORM_TYPES)}"
             )
 
         if transform_type == 'passthrough':
@@ -243,21 +281,26 @@ class ConfigValidator:
             self.errors.append(f"{route_id}: Empty JQ expression")
             return
 
-        # Check for balanced braces
-        if expression.count('{') != expression.count('}'):
+        # Check for balanced braces and brackets (one pass over the expression)
+        chars = Counter(expression)
+        if chars['{'] != chars['}']:
             self.warnings.append(f"{route_id}: Unbalanced braces in JQ expression")
 
-        if expression.count('[') != expression.count(']'):
+        if chars['['] != chars[']']:
             self.warnings.append(f"{route_id}: Unbalanced brackets in JQ expression")
 
         # Check if expression is valid JSON (object or array)
-        try:
-            json.loads(expression)
-            self.warnings.append(
-                f"{route_id}: JQ expression is static JSON, not a transformation"
-            )
-        except json.JSONDecodeError:
-            pass  # Expected for valid JQ expressions
+        stripped = expression.lstrip()
+        if stripped[0] in JSON_START_CHARS:
+            import json
+
+            try:
+                json.loads(stripped)
+                self.warnings.append(
+                    f"{route_id}: JQ expression is static JSON, not a transformation"
+                )
+            except json.JSONDecodeError:
+                pass  # Expected for valid JQ expressions
 
     def _validate_jsonpath_expression(self, expression: str, route_id: str):
         """Validate JSONPath expression."""
@@ -268,19 +311,21 @@ class ConfigValidator:
 
     def _validate_template(self, template: str, route_id: str):
         """Validate template syntax."""
+        if '{{' not in template and '}}' not in template:
+            return  # No template variables
+
         # Check for balanced template variables
         opens = template.count('{{')
         closes = template.count('}}')
         if opens != closes:
             self.errors.append(f"{route_id}: Unbalanced template variables")
 
-        # Extract and validate template variables
-        variables = re.findall(r'\{\{([^}]+)\}\}', template)
-        for var in variables:
-            var = var.strip()
+        # Extract and validate template variables as they are found
+        for match in TEMPLATE_VAR_RE.finditer(template):
+            var = match.group(1).strip()
             if not var:
                 self.errors.append(f"{route_id}: Empty template variable")
-            elif not re.match(r'^[a-zA-Z_][a-zA-Z0-9_.]*$', var):
+            elif not TEMPLATE_VAR_NAME_RE.match(var):
                 self.warnings.append(
                     f"{route_id}: Template variable '{var}' has unusual format"
                 )
@@ -299,7 +344,7 @@ class ConfigValidator:
                 self.errors.append(f"{route_id}: Invalid field path for header '{header_name}'")
 
             # Validate header name format
-            if not re.match(r'^[A-Za-z0-9-]+$', header_name):
+            if not HEADER_NAME_RE.match(header_name):
                 self.warnings.append(
                     f"{route_id}: Header name '{header_name}' contains unusual characters"
                 )
@@ -351,24 +396,39 @@ class ConfigValidator:
             print(f"\n❌ Validation failed with {len(self.errors)} errors")
 
 
+def validate_route(route: Dict[str, Any], route_id: str) -> Tuple[List[str], List[str]]:
+    """Validate a single route on its own, returning its errors and warnings."""
+    validator = ConfigValidator({})
+    validator._validate_route(route, route_id)
+    return validator.errors, validator.warnings
+
+
 def load_config(file_path: Path) -> Optional[Dict[str, Any]]:
     """Load and parse configuration file."""
+    import yaml
+
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        from yaml import CSafeLoader as SafeLoader  # libyaml bindings, when available
+    except ImportError:
+        from yaml import SafeLoader
 
-        # Check if it's a Kubernetes ConfigMap
-        docs = list(yaml.safe_load_all(content))
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read()
 
-        for doc in docs:
+        # Check if it's a Kubernetes ConfigMap, stopping at the first one
+        first = None
+        for idx, doc in enumerate(yaml.load_all(content, Loader=SafeLoader)):
+            if idx == 0:
+                first = doc
             if doc and doc.get('kind') == 'ConfigMap':
                 # Extract routing config from ConfigMap
                 if 'data' in doc and 'routing.yaml' in doc['data']:
                     print(f"📋 Extracting routing config from ConfigMap")
-                    return yaml.safe_load(doc['data']['routing.yaml'])
+                    return yaml.load(doc['data']['routing.yaml'], Loader=SafeLoader)
 
         # If not a ConfigMap, return first document
-        return docs[0] if docs else None
+        return first
 
     except FileNotFoundError:
         print(f"❌ Error: File not found: {file_path}")
@@ -1,17 +1,24 @@
 """FastAPI application factory."""
 
+import asyncio
+import time
+from collections.abc import Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from re import Pattern
+from typing import Any
 
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette.responses import Response
+from starlette.routing import BaseRoute, Route
 
 from openhqm import __version__
-from openhqm.api.dependencies import cleanup_resources, get_cache, get_queue
+from openhqm.api.dependencies import cleanup_resources, get_cache, get_publisher, get_queue
 from openhqm.api.models import HealthResponse
 from openhqm.api.routes import router
 from openhqm.config import settings
@@ -20,6 +27,85 @@ from openhqm.utils.metrics import metrics
 
 logger = structlog.get_logger(__name__)
 
+# Seconds a health check result is reused, and the limit for each component probe
+HEALTH_CACHE_TTL = 1.0
+HEALTH_PROBE_TIMEOUT = 2.0
+
+# Endpoint label for requests that match no route
+UNMATCHED_ENDPOINT = "unmatched"
+
+# Static request paths already resolved to their route, and metric children
+# per label set; both are bounded by the number of routes
+_endpoint_labels: dict[str, str] = {}
+_in_flight_children: dict[str, Any] = {}
+_requests_total_children: dict[tuple[str, str, int], Any] = {}
+
+
+def _route_templates(routes: Sequence[BaseRoute]) -> list[tuple[Pattern[str], str]]:
+    """Collect (path regex, template) pairs, descending into included routers."""
+    templates = []
+    for route in routes:
+        if isinstance(route, Route):
+            templates.append((route.path_regex, route.path))
+        elif (included := getattr(route, "original_router", None)) is not None:
+            # FastAPI keeps included routers as nested nodes in the route list
+            templates.extend(_route_templates(included.routes))
+    return templates
+
+
+def _endpoint_label(app: FastAPI, path: str) -> str:
+    """
+    Resolve the endpoint label for a request path.
+
+    Requests are labelled with their route template (e.g.
+    ``/api/v1/status/{correlation_id}``) rather than the raw path, so
+    metric cardinality stays bounded by the number of routes.
+
+    Args:
+        app: Application handling the request
+        path: Request path
+
+    Returns:
+        Route template, or ``UNMATCHED_ENDPOINT`` if no route matches
+    """
+    label = _endpoint_labels.get(path)
+    if label is not None:
+        return label
+
+    if not hasattr(app.state, "route_templates"):
+        app.state.route_templates = _route_templates(app.router.routes)
+
+    label = UNMATCHED_ENDPOINT
+    for path_regex, template in app.state.route_templates:
+        if path_regex.match(path):
+            label = template
+            break
+
+    if label == path:
+        _endpoint_labels[path] = label
+    return label
+
+
+def _in_flight_gauge(endpoint: str) -> Any:
+    """Get the in-flight gauge child for an endpoint."""
+    child = _in_flight_children.get(endpoint)
+    if child is None:
+        child = _in_flight_children[endpoint] = metrics.api_requests_in_flight.labels(
+            endpoint=endpoint
+        )
+    return child
+
+
+def _requests_total_counter(method: str, endpoint: str, status: int) -> Any:
+    """Get the request counter child for a method, endpoint and status."""
+    key = (method, endpoint, status)
+    child = _requests_total_children.get(key)
+    if child is None:
+        child = _requests_total_children[key] = metrics.api_requests_total.labels(
+            method=method, endpoint=endpoint, status=status
+        )
+    return child
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,10 +114,11 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Starting OpenHQM API", version=__version__)
 
-    # Initialize queue and cache
+    # Initialize queue, cache and publisher up front so requests only read them
     try:
         await get_queue()
         await get_cache()
+        await get_publisher()
         logger.info("Resources initialized successfully")
     except Exception as e:
         logger.error("Failed to initialize resources", error=str(e))
@@ -52,6 +139,10 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+    # No custom default_response_class: every JSON route declares a
+    # response_model, which lets FastAPI serialize responses straight to
+    # bytes with Pydantic's Rust serializer (faster than ORJSONResponse,
+    # which would also turn that path off)
     app = FastAPI(
         title="OpenHQM - HTTP Queue Message Handler",
         description="Asynchronous HTTP request processing system using message queues",
@@ -70,25 +161,40 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress large responses for clients that accept it
+    if settings.server.gzip_min_size:
+        app.add_middleware(GZipMiddleware, minimum_size=settings.server.gzip_min_size)
+
+    # Last health check result and when it expires
+    health_cache: tuple[float, HealthResponse] | None = None
+
     # Health check endpoint
     @app.get("/health", response_model=HealthResponse, tags=["health"])
     async def health_check() -> HealthResponse:
         """
         Health check endpoint.
 
+        Results are reused for ``HEALTH_CACHE_TTL`` seconds, so frequent
+        liveness probes do not each re-probe the queue and cache.
+
         Returns:
             Health status of the application and components
         """
+        nonlocal health_cache
+        now = time.monotonic()
+        if health_cache is not None and now < health_cache[0]:
+            return health_cache[1]
+
         components = {"api": "healthy"}
 
         try:
-            await get_queue()
+            await asyncio.wait_for(get_queue(), HEALTH_PROBE_TIMEOUT)
             components["queue"] = "healthy"
         except Exception:
             components["queue"] = "unhealthy"
 
         try:
-            await get_cache()
+            await asyncio.wait_for(get_cache(), HEALTH_PROBE_TIMEOUT)
             components["cache"] = "healthy"
         except Exception:
             components["cache"] = "unhealthy"
@@ -97,15 +203,21 @@ def create_app() -> FastAPI:
             "healthy" if all(v == "healthy" for v in components.values()) else "degraded"
         )
 
-        return HealthResponse(
+        # Built from trusted values, so skip validation
+        health = HealthResponse.model_construct(
             status=overall_status,
             version=__version__,
             timestamp=datetime.now(UTC),
             components=components,
         )
+        health_cache = (time.monotonic() + HEALTH_CACHE_TTL, health)
+        return health
+
+    # Read once: the request middleware checks it on every request
+    metrics_enabled = settings.monitoring.metrics_enabled
 
     # Metrics endpoint
-    if settings.monitoring.metrics_enabled:
+    if metrics_enabled:
 
         @app.get("/metrics", tags=["monitoring"])
         async def metrics_endpoint() -> Response:
@@ -124,35 +236,37 @@ def create_app() -> FastAPI:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log all HTTP requests."""
-        log = logger.bind(
-            method=request.method,
-            path=request.url.path,
-            client=request.client.host if request.client else None,
-        )
+        method = request.method
+        path = request.url.path
+        client = request.client.host if request.client else None
 
-        log.info("Request received")
+        logger.info("Request received", method=method, path=path, client=client)
 
         # Track in-flight requests
-        if settings.monitoring.metrics_enabled:
-            metrics.api_requests_in_flight.labels(endpoint=request.url.path).inc()
+        if metrics_enabled:
+            endpoint = _endpoint_label(app, path)
+            in_flight = _in_flight_gauge(endpoint)
+            in_flight.inc()
 
         try:
             response = await call_next(request)
 
-            log.info("Request completed", status_code=response.status_code)
+            logger.info(
+                "Request completed",
+                method=method,
+                path=path,
+                client=client,
+                status_code=response.status_code,
+            )
 
             # Track request metrics
-            if settings.monitoring.metrics_enabled:
-                metrics.api_requests_total.labels(
-                    method=request.method,
-                    endpoint=request.url.path,
-                    status=response.status_code,
-                ).inc()
+            if metrics_enabled:
+                _requests_total_counter(method, endpoint, response.status_code).inc()
 
             return response
         finally:
-            if settings.monitoring.metrics_enabled:
-                metrics.api_requests_in_flight.labels(endpoint=request.url.path).dec()
+            if metrics_enabled:
+                in_flight.dec()
 
     # Global exception handler
     @app.exception_handler(Exception)
@@ -2,12 +2,15 @@
 
 from openhqm.cache.factory import create_cache
 from openhqm.cache.interface import CacheInterface
+from openhqm.config import settings
+from openhqm.queue.batcher import PublishBatcher
 from openhqm.queue.factory import create_queue
 from openhqm.queue.interface import MessageQueueInterface
 
 # Global instances
 _queue_instance: MessageQueueInterface | None = None
 _cache_instance: CacheInterface | None = None
+_publisher_instance: PublishBatcher | None = None
 
 
 async def get_queue() -> MessageQueueInterface:
@@ -36,9 +39,31 @@ async def get_cache() -> CacheInterface:
     return _cache_instance
 
 
+async def get_publisher() -> PublishBatcher:
+    """
+    Get the request queue publisher.
+
+    Returns:
+        Publisher for the request queue
+    """
+    global _publisher_instance
+    if _publisher_instance is None:
+        _publisher_instance = PublishBatcher(
+            await get_queue(),
+            "requests",
+            max_batch_size=settings.queue.publish_batch_size,
+            linger_ms=settings.queue.publish_linger_ms,
+        )
+    return _publisher_instance
+
+
 async def cleanup_resources():
     """Clean up global resources on shutdown."""
-    global _queue_instance, _cache_instance
+    global _queue_instance, _cache_instance, _publisher_instance
+
+    if _publisher_instance:
+        await _publisher_instance.close()
+        _publisher_instance = None
 
     if _queue_instance:
         await _queue_instance.disconnect()
@@ -1,20 +1,14 @@
 """Pydantic models for API requests and responses."""
 
 from datetime import datetime
-from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from openhqm.status import RequestStatus
 
-class RequestStatus(StrEnum):
-    """Request processing status."""
-
-    PENDING = "PENDING"
-    PROCESSING = "PROCESSING"
-    COMPLETED = "COMPLETED"
-    FAILED = "FAILED"
-    TIMEOUT = "TIMEOUT"
+# Maximum number of items accepted by the batch endpoints
+MAX_BATCH_SIZE = 100
 
 
 class RequestMetadata(BaseModel):
@@ -63,6 +57,20 @@ class SubmitResponse(BaseModel):
     }
 
 
+class SubmitBatchRequest(BaseModel):
+    """Request model for submitting several requests at once."""
+
+    items: list[SubmitRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="Requests to submit"
+    )
+
+
+class SubmitBatchResponse(BaseModel):
+    """Response model for batch submission."""
+
+    items: list[SubmitResponse] = Field(..., description="One response per submitted item")
+
+
 class StatusResponse(BaseModel):
     """Response model for status check."""
 
@@ -109,6 +117,12 @@ class ResultResponse(BaseModel):
     }
 
 
+class ResultBatchResponse(BaseModel):
+    """Response model for batch result retrieval."""
+
+    items: list[ResultResponse] = Field(..., description="Results of the known requests")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
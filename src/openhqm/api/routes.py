@@ -1,113 +1,341 @@
 """API route handlers."""
 
+import asyncio
+import functools
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from openhqm.api.dependencies import get_cache, get_queue
+from openhqm.api.dependencies import get_cache, get_publisher
 from openhqm.api.models import (
+    MAX_BATCH_SIZE,
     RequestStatus,
+    ResultBatchResponse,
     ResultResponse,
     StatusResponse,
+    SubmitBatchRequest,
+    SubmitBatchResponse,
     SubmitRequest,
     SubmitResponse,
 )
 from openhqm.cache.interface import CacheInterface
-from openhqm.queue.interface import MessageQueueInterface
+from openhqm.config import settings
+from openhqm.queue.batcher import PublishBatcher
+from openhqm.status import TERMINAL_STATUSES
 from openhqm.utils.metrics import metrics
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["requests"])
 
+# Status members by stored value; a dict lookup is cheaper than calling RequestStatus(value)
+STATUS_BY_VALUE: dict[str, RequestStatus] = {member.value: member for member in RequestStatus}
 
-@router.post(
-    "/submit",
-    response_model=SubmitResponse,
-    status_code=status.HTTP_202_ACCEPTED,
-    summary="Submit a new request",
-    description="Queue a request for asynchronous processing with transparent header forwarding",
-)
-async def submit_request(
+# Backoff bounds for long-polling the cache while a client waits
+LONG_POLL_INITIAL_DELAY = 0.025
+LONG_POLL_MAX_DELAY = 0.5
+
+# Body of the 404 for unknown or expired requests, encoded once
+NOT_FOUND_BODY = b'{"detail":"Request not found or expired"}'
+
+# Request queue publish counters, labeled once instead of on every submit
+_PUBLISH_SUCCEEDED = metrics.queue_publish_total.labels(queue_name="requests", status="success")
+_PUBLISH_FAILED = metrics.queue_publish_total.labels(queue_name="requests", status="failed")
+
+
+def _not_found() -> Response:
+    """
+    Build the 404 for an unknown or expired request.
+
+    Polling after the entries expire is routine, so this is returned rather
+    than raised to keep it off the exception handling path. The body matches
+    what raising ``HTTPException`` would produce.
+    """
+    return Response(
+        content=NOT_FOUND_BODY,
+        status_code=status.HTTP_404_NOT_FOUND,
+        media_type="application/json",
+    )
+
+
+async def _wait_for_entries(
+    cache: CacheInterface, correlation_id: str, wait: float
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """
+    Read a request's metadata and response entries, holding on for up to
+    ``wait`` seconds until its status is final.
+
+    Both entries are fetched together, one cache round-trip per read.
+    While waiting, the response key is watched so a worker's completion
+    notification ends the wait early; the backoff only bounds how long a
+    missed notification can delay the answer.
+
+    Args:
+        cache: Cache instance
+        correlation_id: Request correlation ID
+        wait: Maximum time to wait in seconds (0 = single read)
+
+    Returns:
+        Latest request metadata (None if the request is unknown) and
+        response entry (None if there is none yet)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    keys = [f"req:{correlation_id}:meta", f"resp:{correlation_id}"]
+
+    metadata, response_data = await cache.mget(keys)
+    if not metadata or metadata.get("status") in TERMINAL_STATUSES or not wait:
+        return metadata, response_data
+
+    delay = LONG_POLL_INITIAL_DELAY
+    async with cache.watch(keys[1]) as wait_for_change:
+        while (remaining := deadline - loop.time()) > 0:
+            await wait_for_change(min(delay, remaining))
+            delay = min(delay * 2, LONG_POLL_MAX_DELAY)
+
+            metadata, response_data = await cache.mget(keys)
+            if not metadata or metadata.get("status") in TERMINAL_STATUSES:
+                break
+
+    return metadata, response_data
+
+
+async def _confirm_publish(
+    cache: CacheInterface,
+    correlation_id: str,
+    submitted_at: str,
+    success: bool,
+) -> None:
+    """
+    Record the outcome of a publish that the client did not wait for.
+
+    A failed publish marks the request FAILED, so clients polling for it
+    get an error instead of waiting on a message that was never queued.
+
+    Args:
+        cache: Cache instance
+        correlation_id: Request correlation ID
+        submitted_at: When the request was submitted (ISO 8601)
+        success: Whether the broker confirmed the message
+    """
+    if success:
+        _PUBLISH_SUCCEEDED.inc()
+        return
+
+    _PUBLISH_FAILED.inc()
+    logger.error("Failed to queue request", correlation_id=correlation_id)
+
+    failed_at = datetime.now(UTC).isoformat()
+    await cache.set_many(
+        {
+            f"req:{correlation_id}:meta": {
+                "status": RequestStatus.FAILED.value,
+                "submitted_at": submitted_at,
+                "updated_at": failed_at,
+            },
+            f"resp:{correlation_id}": {
+                "error": "Unable to queue request",
+                "completed_at": failed_at,
+            },
+        },
+        ttl=3600,
+        notify=True,
+    )
+
+
+async def _enqueue_request(
     request: SubmitRequest,
-    queue: MessageQueueInterface = Depends(get_queue),
-    cache: CacheInterface = Depends(get_cache),
+    publisher: PublishBatcher,
+    cache: CacheInterface,
 ) -> SubmitResponse:
     """
-    Submit a request for asynchronous processing.
-
-    - Generates a unique correlation ID
-    - Validates the payload
-    - Forwards headers transparently
-    - Queues the request
-    - Returns the correlation ID for tracking
+    Record a request as pending and publish it to the request queue.
 
     Args:
         request: The request to submit (with payload, headers, metadata)
-        queue: Message queue instance
+        publisher: Request queue publisher
         cache: Cache instance
 
     Returns:
         Response with correlation ID and status
 
     Raises:
-        HTTPException: If queueing fails
+        HTTPException: If recording or queueing the request fails
     """
     correlation_id = str(uuid.uuid4())
     submitted_at = datetime.now(UTC)
+    submitted_iso = submitted_at.isoformat()
 
     log = logger.bind(correlation_id=correlation_id)
-    log.info("Submitting request", payload_size=len(str(request.payload)))
+    log.info("Submitting request", payload_keys=len(request.payload))
 
     # Prepare message
     message = {
         "correlation_id": correlation_id,
         "payload": request.payload,
         "headers": request.headers,
-        "timestamp": submitted_at.isoformat(),
+        "timestamp": submitted_iso,
         "metadata": request.metadata.model_dump() if request.metadata else {},
     }
 
+    # Store metadata in cache
     try:
-        # Store metadata in cache
         await cache.set(
             f"req:{correlation_id}:meta",
             {
                 "status": RequestStatus.PENDING.value,
-                "submitted_at": submitted_at.isoformat(),
-                "updated_at": submitted_at.isoformat(),
+                "submitted_at": submitted_iso,
+                "updated_at": submitted_iso,
             },
             ttl=3600,
         )
+    except Exception as e:
+        log.error("Failed to record request", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to record request. Service temporarily unavailable.",
+        ) from e
+
+    # Publish to queue
+    if settings.queue.publish_async:
+        publisher.publish_nowait(
+            message,
+            functools.partial(_confirm_publish, cache, correlation_id, submitted_iso),
+        )
+    else:
+        try:
+            success = await publisher.publish(message)
+        except Exception as e:
+            _PUBLISH_FAILED.inc()
+            log.error("Failed to submit request", error=str(e))
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to submit request",
+            ) from e
 
-        # Publish to queue
-        success = await queue.publish("requests", message)
         if not success:
-            metrics.queue_publish_total.labels(queue_name="requests", status="failed").inc()
+            _PUBLISH_FAILED.inc()
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Unable to queue request. Service temporarily unavailable.",
             )
+        _PUBLISH_SUCCEEDED.inc()
 
-        metrics.queue_publish_total.labels(queue_name="requests", status="success").inc()
-        log.info("Request submitted successfully")
+    log.info("Request submitted successfully")
 
-        return SubmitResponse(
-            correlation_id=correlation_id,
-            status=RequestStatus.PENDING,
-            submitted_at=submitted_at,
-        )
+    # Built from trusted values, so skip validation
+    return SubmitResponse.model_construct(
+        correlation_id=correlation_id,
+        status=RequestStatus.PENDING,
+        submitted_at=submitted_at,
+    )
 
-    except HTTPException:
-        raise
+
+@router.post(
+    "/submit",
+    response_model=SubmitResponse | ResultResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a new request",
+    description="Queue a request for asynchronous processing with transparent header forwarding",
+    responses={200: {"model": ResultResponse, "description": "Completed within `wait`"}},
+)
+async def submit_request(
+    request: SubmitRequest,
+    wait: float = Query(
+        default=0,
+        ge=0,
+        le=30,
+        description="Seconds to wait for the result before answering with 202",
+    ),
+    publisher: PublishBatcher = Depends(get_publisher),
+    cache: CacheInterface = Depends(get_cache),
+    response: Response = None,  # type: ignore[assignment]
+) -> SubmitResponse | ResultResponse:
+    """
+    Submit a request for asynchronous processing.
+
+    - Generates a unique correlation ID
+    - Validates the payload
+    - Forwards headers transparently
+    - Queues the request
+    - Returns the correlation ID for tracking
+
+    With ``wait`` set, the call also waits for the request to finish and
+    returns its result inline (200), saving a separate result lookup.
+
+    Args:
+        request: The request to submit (with payload, headers, metadata)
+        wait: Maximum time to wait for the result in seconds
+        publisher: Request queue publisher
+        cache: Cache instance
+
+    Returns:
+        Response with correlation ID and status, or the result if it
+        completed within ``wait``
+
+    Raises:
+        HTTPException: If queueing fails
+    """
+    submitted = await _enqueue_request(request, publisher, cache)
+    if not wait:
+        return submitted
+
+    correlation_id = submitted.correlation_id
+    try:
+        metadata, response_data = await _wait_for_entries(cache, correlation_id, wait)
+        if not metadata:
+            return submitted
+
+        req_status = STATUS_BY_VALUE[metadata["status"]]
+        if not _is_ready(req_status, response_data):
+            return submitted
     except Exception as e:
-        log.error("Failed to submit request", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to submit request",
-        ) from e
+        # The request is queued either way; let the client fetch the result
+        logger.warning("Failed to wait for result", correlation_id=correlation_id, error=str(e))
+        return submitted
+
+    if response is not None:
+        response.status_code = status.HTTP_200_OK
+    return _build_result(correlation_id, req_status, response_data)
+
+
+@router.post(
+    "/submit-batch",
+    response_model=SubmitBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit several requests at once",
+    description="Queue a batch of requests in a single call, one correlation ID per item",
+)
+async def submit_batch(
+    batch: SubmitBatchRequest,
+    publisher: PublishBatcher = Depends(get_publisher),
+    cache: CacheInterface = Depends(get_cache),
+) -> SubmitBatchResponse:
+    """
+    Submit a batch of requests for asynchronous processing.
+
+    Items are queued concurrently and returned in submission order. If any
+    item fails to queue the whole call fails; items queued before the
+    failure are still processed.
+
+    Args:
+        batch: Requests to submit
+        publisher: Request queue publisher
+        cache: Cache instance
+
+    Returns:
+        One submit response per item
+
+    Raises:
+        HTTPException: If queueing any item fails
+    """
+    items = await asyncio.gather(
+        *(_enqueue_request(item, publisher, cache) for item in batch.items)
+    )
+    return SubmitBatchResponse(items=list(items))
 
 
 @router.get(
@@ -119,7 +347,7 @@ async def submit_request(
 async def get_status(
     correlation_id: str,
     cache: CacheInterface = Depends(get_cache),
-) -> StatusResponse:
+) -> StatusResponse | Response:
     """
     Get the status of a request.
 
@@ -128,10 +356,11 @@ async def get_status(
         cache: Cache instance
 
     Returns:
-        Current request status
+        Current request status, or a 404 response if the request is
+        unknown or expired
 
     Raises:
-        HTTPException: If request not found
+        HTTPException: If the status cannot be read
     """
     log = logger.bind(correlation_id=correlation_id)
     log.info("Checking request status")
@@ -140,20 +369,15 @@ async def get_status(
         # Get metadata from cache
         metadata = await cache.get(f"req:{correlation_id}:meta")
         if not metadata:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Request not found or expired",
-            )
+            return _not_found()
 
         return StatusResponse(
             correlation_id=correlation_id,
-            status=RequestStatus(metadata["status"]),
+            status=STATUS_BY_VALUE[metadata["status"]],
             submitted_at=datetime.fromisoformat(metadata["submitted_at"]),
             updated_at=datetime.fromisoformat(metadata.get("updated_at", metadata["submitted_at"])),
         )
 
-    except HTTPException:
-        raise
     except Exception as e:
         log.error("Failed to get status", error=str(e))
         raise HTTPException(
@@ -162,6 +386,56 @@ async def get_status(
         ) from e
 
 
+def _is_ready(req_status: RequestStatus, response_data: dict[str, Any] | None) -> bool:
+    """Check whether a request has a result (or error) to hand back."""
+    return req_status == RequestStatus.FAILED or (
+        req_status == RequestStatus.COMPLETED and bool(response_data)
+    )
+
+
+def _build_result(
+    correlation_id: str,
+    req_status: RequestStatus,
+    response_data: dict[str, Any] | None,
+) -> ResultResponse:
+    """
+    Build the result response for a request from its cached entries.
+
+    Args:
+        correlation_id: Request correlation ID
+        req_status: Current request status
+        response_data: Cached response entry, if any
+
+    Returns:
+        Result response (without result data while still processing)
+    """
+    if req_status == RequestStatus.COMPLETED and response_data:
+        return ResultResponse(
+            correlation_id=correlation_id,
+            status=req_status,
+            result=response_data.get("result"),
+            headers=response_data.get("headers"),
+            status_code=response_data.get("status_code"),
+            processing_time_ms=response_data.get("processing_time_ms"),
+            completed_at=datetime.fromisoformat(response_data["completed_at"]),
+        )
+    elif req_status == RequestStatus.FAILED:
+        return ResultResponse(
+            correlation_id=correlation_id,
+            status=req_status,
+            error=response_data.get("error") if response_data else "Processing failed",
+            completed_at=(
+                datetime.fromisoformat(response_data["completed_at"]) if response_data else None
+            ),
+        )
+    else:
+        return ResultResponse(
+            correlation_id=correlation_id,
+            status=req_status,
+            result=None,
+        )
+
+
 @router.get(
     "/response/{correlation_id}",
     response_model=ResultResponse,
@@ -170,74 +444,111 @@ async def get_status(
 )
 async def get_response(
     correlation_id: str,
+    wait: float = Query(
+        default=0,
+        ge=0,
+        le=30,
+        description="Seconds to hold the request open waiting for a final status",
+    ),
     cache: CacheInterface = Depends(get_cache),
     response: Response = None,  # type: ignore[assignment]
-) -> ResultResponse:
+) -> ResultResponse | Response:
     """
     Get the result of a processed request.
 
+    With ``wait`` set the call long-polls, returning as soon as the request
+    completes or fails instead of making the client poll repeatedly.
+
     Args:
         correlation_id: Request correlation ID
+        wait: Maximum time to wait for a final status in seconds
         cache: Cache instance
 
     Returns:
-        Request result if completed, or current status
+        Request result if completed, current status otherwise, or a 404
+        response if the request is unknown or expired
 
     Raises:
-        HTTPException: If request not found
+        HTTPException: If the result cannot be read
     """
     log = logger.bind(correlation_id=correlation_id)
     log.info("Retrieving request response")
 
     try:
-        # Get metadata
-        metadata = await cache.get(f"req:{correlation_id}:meta")
+        # Get metadata and response (if available)
+        metadata, response_data = await _wait_for_entries(cache, correlation_id, wait)
         if not metadata:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Request not found or expired",
-            )
+            return _not_found()
 
-        req_status = RequestStatus(metadata["status"])
-
-        # Get response if available
-        response_data = await cache.get(f"resp:{correlation_id}")
-
-        if req_status == RequestStatus.COMPLETED and response_data:
-            return ResultResponse(
-                correlation_id=correlation_id,
-                status=req_status,
-                result=response_data.get("result"),
-                headers=response_data.get("headers"),
-                status_code=response_data.get("status_code"),
-                processing_time_ms=response_data.get("processing_time_ms"),
-                completed_at=datetime.fromisoformat(response_data["completed_at"]),
-            )
-        elif req_status == RequestStatus.FAILED:
-            return ResultResponse(
-                correlation_id=correlation_id,
-                status=req_status,
-                error=response_data.get("error") if response_data else "Processing failed",
-                completed_at=(
-                    datetime.fromisoformat(response_data["completed_at"]) if response_data else None
-                ),
-            )
-        else:
+        req_status = STATUS_BY_VALUE[metadata["status"]]
+        result = _build_result(correlation_id, req_status, response_data)
+        if not _is_ready(req_status, response_data) and response is not None:
             # Still processing — set 202 Accepted on the response object so
             # FastAPI serialises through ResultResponse (keeps the type correct)
-            if response is not None:
-                response.status_code = status.HTTP_202_ACCEPTED
-            return ResultResponse(
-                correlation_id=correlation_id,
-                status=req_status,
-                result=None,
-            )
+            response.status_code = status.HTTP_202_ACCEPTED
+        return result
 
-    except HTTPException:
-        raise
     except Exception as e:
         log.error("Failed to get response", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve response",
         ) from e
+
+
+@router.get(
+    "/responses",
+    response_model=ResultBatchResponse,
+    summary="Get several request results",
+    description="Retrieve the results of several requests in a single call",
+)
+async def get_responses(
+    ids: str = Query(
+        ...,
+        description="Comma-separated correlation IDs",
+        examples=["550e8400-e29b-41d4-a716-446655440000,6ba7b810-9dad-11d1-80b4-00c04fd430c8"],
+    ),
+    cache: CacheInterface = Depends(get_cache),
+) -> ResultBatchResponse:
+    """
+    Get the results of several requests.
+
+    Unknown or expired correlation IDs are left out of the response.
+
+    Args:
+        ids: Comma-separated correlation IDs
+        cache: Cache instance
+
+    Returns:
+        Result (or current status) for each known request, in request order
+
+    Raises:
+        HTTPException: If too many IDs are requested
+    """
+    correlation_ids = [cid for cid in (part.strip() for part in ids.split(",")) if cid]
+    if len(correlation_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_SIZE} correlation IDs per call",
+        )
+
+    # Fetch every request's metadata and response entries in one round-trip
+    keys = [key for cid in correlation_ids for key in (f"req:{cid}:meta", f"resp:{cid}")]
+
+    try:
+        values = await cache.mget(keys)
+        results = [
+            _build_result(cid, STATUS_BY_VALUE[metadata["status"]], response_data)
+            for cid, metadata, response_data in zip(
+                correlation_ids, values[::2], values[1::2], strict=True
+            )
+            if metadata
+        ]
+    except Exception as e:
+        logger.error("Failed to get responses", count=len(correlation_ids), error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve responses",
+        ) from e
+
+    return ResultBatchResponse(items=results)
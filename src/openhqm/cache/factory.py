@@ -1,6 +1,7 @@
 """Factory for creating cache instances."""
 
 from openhqm.cache.interface import CacheInterface
+from openhqm.cache.layered import LayeredCache
 from openhqm.cache.redis_cache import RedisCache
 from openhqm.config import settings
 
@@ -21,6 +22,14 @@ async def create_cache() -> CacheInterface:
             max_connections=settings.cache.max_connections,
         )
         await cache.connect()
-        return cache
     else:
         raise ValueError(f"Unsupported cache type: {cache_type}")
+
+    if settings.cache.local_ttl_ms:
+        return LayeredCache(
+            cache,
+            ttl=settings.cache.local_ttl_ms / 1000,
+            final_ttl=settings.cache.local_final_ttl_ms / 1000,
+            max_entries=settings.cache.local_max_entries,
+        )
+    return cache
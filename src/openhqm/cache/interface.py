@@ -1,6 +1,9 @@
 """Cache interface definition."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Any
 
 
@@ -20,6 +23,21 @@ class CacheInterface(ABC):
         """
         pass
 
+    async def mget(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get several values from cache.
+
+        The default implementation calls ``get`` for each key concurrently;
+        backends that can fetch several keys in one round-trip override it.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached value or None for each key, in key order
+        """
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
     @abstractmethod
     async def set(
         self,
@@ -40,6 +58,33 @@ class CacheInterface(ABC):
         """
         pass
 
+    async def set_many(
+        self,
+        items: dict[str, dict[str, Any]],
+        ttl: int | None = None,
+        notify: bool = False,
+    ) -> bool:
+        """
+        Set several values in cache, optionally announcing each key.
+
+        The default implementation calls ``set`` for each item concurrently
+        and then ``notify``; backends that can write several keys in one
+        atomic round-trip override it.
+
+        Args:
+            items: Values to cache, by key
+            ttl: Time to live in seconds
+            notify: Whether to call :meth:`notify` for each written key
+
+        Returns:
+            True if every value was stored
+        """
+        results = await asyncio.gather(*(self.set(key, value, ttl) for key, value in items.items()))
+        if notify:
+            for key in items:
+                await self.notify(key)
+        return all(results)
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """
@@ -66,6 +111,41 @@ class CacheInterface(ABC):
         """
         pass
 
+    async def notify(self, key: str) -> None:
+        """
+        Announce that a key has been written, waking anyone watching it.
+
+        Optional - the default does nothing, so watchers fall back to polling.
+
+        Args:
+            key: Cache key that changed
+        """
+        return None
+
+    @asynccontextmanager
+    async def watch(self, key: str) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+        """
+        Watch a key for change notifications.
+
+        Yields a ``wait(timeout)`` function that returns True as soon as the
+        key is announced via :meth:`notify`, or False once ``timeout``
+        seconds pass. Notifications are a hint: callers must re-read the key
+        and keep a timeout. The default never wakes early, which reduces to
+        plain polling.
+
+        Args:
+            key: Cache key to watch
+
+        Yields:
+            Function waiting up to the given number of seconds for a change
+        """
+
+        async def wait(timeout: float) -> bool:
+            await asyncio.sleep(timeout)
+            return False
+
+        yield wait
+
     @abstractmethod
     async def close(self) -> None:
         """Close cache connection."""
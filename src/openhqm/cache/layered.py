@@ -0,0 +1,191 @@
+"""Process-local cache layered in front of a shared cache backend."""
+
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from openhqm.cache.interface import CacheInterface
+from openhqm.status import TERMINAL_STATUSES
+
+
+class LayeredCache(CacheInterface):
+    """
+    Serve repeated ``get`` calls from process memory for a short time.
+
+    Clients polling a request's status hit the same key many times a
+    second; within ``ttl`` seconds those reads are answered locally instead
+    of going to the backend. Entries in a final status cannot change, so
+    they are kept for ``final_ttl`` instead.
+
+    Only ``get`` reads through the local layer. ``mget`` always goes to the
+    backend (long-polling and result fetches must see fresh entries as soon
+    as they are notified) and refreshes the local copies. Writes and deletes
+    made through this instance drop the local copy; writes made by other
+    processes become visible once the local entry expires.
+    """
+
+    def __init__(
+        self,
+        backend: CacheInterface,
+        ttl: float,
+        final_ttl: float | None = None,
+        max_entries: int = 10_000,
+    ):
+        """
+        Initialize layered cache.
+
+        Args:
+            backend: Shared cache to read through to
+            ttl: Seconds to serve an entry locally
+            final_ttl: Seconds to serve an entry in a final status locally
+                (defaults to ``ttl``)
+            max_entries: Maximum number of locally held entries
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.final_ttl = ttl if final_ttl is None else final_ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, dict[str, Any] | None]] = {}
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get value from the local layer, falling back to the backend.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                return value
+            del self._entries[key]
+
+        value = await self.backend.get(key)
+        self._remember(key, value)
+        return value
+
+    async def mget(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get several values from the backend, refreshing the local layer.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached value or None for each key, in key order
+        """
+        values = await self.backend.mget(keys)
+        for key, value in zip(keys, values, strict=True):
+            self._remember(key, value)
+        return values
+
+    async def set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ttl: int | None = None,
+    ) -> bool:
+        """
+        Set value in the backend and drop the local copy.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful
+        """
+        self._entries.pop(key, None)
+        return await self.backend.set(key, value, ttl)
+
+    async def set_many(
+        self,
+        items: dict[str, dict[str, Any]],
+        ttl: int | None = None,
+        notify: bool = False,
+    ) -> bool:
+        """
+        Set several values in the backend and drop their local copies.
+
+        Args:
+            items: Values to cache, by key
+            ttl: Time to live in seconds
+            notify: Whether to announce each written key
+
+        Returns:
+            True if every value was stored
+        """
+        for key in items:
+            self._entries.pop(key, None)
+        return await self.backend.set_many(items, ttl, notify)
+
+    async def delete(self, key: str) -> bool:
+        """
+        Delete key from the backend and the local layer.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if successful
+        """
+        self._entries.pop(key, None)
+        return await self.backend.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        """
+        Check if key exists in the backend.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key exists
+        """
+        return await self.backend.exists(key)
+
+    async def notify(self, key: str) -> None:
+        """
+        Announce a key change through the backend.
+
+        Args:
+            key: Cache key that changed
+        """
+        await self.backend.notify(key)
+
+    @asynccontextmanager
+    async def watch(self, key: str) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+        """
+        Watch a key for change notifications through the backend.
+
+        Args:
+            key: Cache key to watch
+
+        Yields:
+            Function waiting up to the given number of seconds for a change
+        """
+        async with self.backend.watch(key) as wait:
+            yield wait
+
+    async def close(self) -> None:
+        """Drop local entries and close the backend."""
+        self._entries.clear()
+        await self.backend.close()
+
+    def _remember(self, key: str, value: dict[str, Any] | None) -> None:
+        """Hold a backend value locally, evicting the oldest entry when full."""
+        final = value is not None and value.get("status") in TERMINAL_STATUSES
+        ttl = self.final_ttl if final else self.ttl
+        if ttl <= 0:
+            return
+
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
@@ -1,18 +1,29 @@
 """Redis cache implementation."""
 
-import json
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 import redis.asyncio as aioredis
 import structlog
 
 from openhqm.cache.interface import CacheInterface
+from openhqm.utils import serialization
 
 logger = structlog.get_logger(__name__)
 
+# Pub/sub channel prefix for key change notifications (followed by the key)
+NOTIFY_CHANNEL_PREFIX = "openhqm:changed:"
+
 
 class RedisCache(CacheInterface):
-    """Redis cache implementation."""
+    """
+    Redis cache implementation.
+
+    :meth:`connect` must be awaited before use (``create_cache`` does this);
+    the data methods assume a live client rather than reconnecting per call.
+    """
 
     def __init__(self, url: str, default_ttl: int = 3600, max_connections: int = 10):
         """
@@ -27,13 +38,18 @@ class RedisCache(CacheInterface):
         self.default_ttl = default_ttl
         self.max_connections = max_connections
         self.redis: aioredis.Redis | None = None
+        self._watchers: dict[str, set[asyncio.Event]] = {}
+        self._listener: asyncio.Task | None = None
 
     async def connect(self) -> None:
-        """Connect to Redis."""
+        """Connect to Redis; does nothing if already connected."""
+        if self.redis is not None:
+            return
+
         self.redis = await aioredis.from_url(
             self.url,
             max_connections=self.max_connections,
-            decode_responses=True,
+            decode_responses=False,  # Values are JSON bytes, decoded by orjson/json
         )
         await self.redis.ping()
         logger.info("Connected to Redis cache", url=self.url)
@@ -48,18 +64,32 @@ class RedisCache(CacheInterface):
         Returns:
             Cached value or None
         """
-        if not self.redis:
-            await self.connect()
-
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return serialization.loads(value)
             return None
         except Exception as e:
             logger.error("Failed to get from cache", key=key, error=str(e))
             return None
 
+    async def mget(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get several values from cache in a single round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached value or None for each key, in key order
+        """
+        try:
+            values = await self.redis.mget(keys)
+            return [serialization.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error("Failed to get from cache", keys=keys, error=str(e))
+            return [None] * len(keys)
+
     async def set(
         self,
         key: str,
@@ -77,11 +107,8 @@ class RedisCache(CacheInterface):
         Returns:
             True if successful
         """
-        if not self.redis:
-            await self.connect()
-
         try:
-            serialized = json.dumps(value)
+            serialized = serialization.dumps(value)
             ttl = ttl or self.default_ttl
 
             await self.redis.set(key, serialized, ex=ttl)
@@ -90,6 +117,40 @@ class RedisCache(CacheInterface):
             logger.error("Failed to set in cache", key=key, error=str(e))
             return False
 
+    async def set_many(
+        self,
+        items: dict[str, dict[str, Any]],
+        ttl: int | None = None,
+        notify: bool = False,
+    ) -> bool:
+        """
+        Set several values atomically in a single round-trip.
+
+        The writes (and notifications) go out as one MULTI/EXEC block, so
+        readers never see one key updated without the others.
+
+        Args:
+            items: Values to cache, by key
+            ttl: TTL in seconds
+            notify: Whether to publish a change notification for each key
+
+        Returns:
+            True if successful
+        """
+        try:
+            ttl = ttl or self.default_ttl
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, serialization.dumps(value), ex=ttl)
+                if notify:
+                    for key in items:
+                        pipe.publish(NOTIFY_CHANNEL_PREFIX + key, b"")
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Failed to set in cache", keys=list(items), error=str(e))
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -100,9 +161,6 @@ class RedisCache(CacheInterface):
         Returns:
             True if successful
         """
-        if not self.redis:
-            return False
-
         try:
             await self.redis.delete(key)
             return True
@@ -120,17 +178,86 @@ class RedisCache(CacheInterface):
         Returns:
             True if exists
         """
-        if not self.redis:
-            return False
-
         try:
             return await self.redis.exists(key) > 0
         except Exception as e:
             logger.error("Failed to check existence", key=key, error=str(e))
             return False
 
+    async def notify(self, key: str) -> None:
+        """
+        Publish a change notification for a key.
+
+        Args:
+            key: Cache key that changed
+        """
+        try:
+            await self.redis.publish(NOTIFY_CHANNEL_PREFIX + key, b"")
+        except Exception as e:
+            logger.warning("Failed to publish cache notification", key=key, error=str(e))
+
+    @contextlib.asynccontextmanager
+    async def watch(self, key: str) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+        """
+        Watch a key for change notifications.
+
+        All watches share one pattern subscription, so waiting does not tie
+        up a pool connection per caller.
+
+        Args:
+            key: Cache key to watch
+
+        Yields:
+            Function waiting up to the given number of seconds for a change
+        """
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+        event = asyncio.Event()
+        watchers = self._watchers.setdefault(key, set())
+        watchers.add(event)
+
+        async def wait(timeout: float) -> bool:
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except TimeoutError:
+                return False
+            event.clear()
+            return True
+
+        try:
+            yield wait
+        finally:
+            watchers.discard(event)
+            if not watchers:
+                self._watchers.pop(key, None)
+
+    async def _listen(self) -> None:
+        """Dispatch change notifications to the events of current watchers."""
+        prefix_len = len(NOTIFY_CHANNEL_PREFIX)
+        try:
+            async with self.redis.pubsub() as pubsub:
+                await pubsub.psubscribe(NOTIFY_CHANNEL_PREFIX + "*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    key = message["channel"][prefix_len:].decode()
+                    for event in self._watchers.get(key, ()):
+                        event.set()
+        except Exception as e:
+            # Watchers keep polling; the next watch() resubscribes
+            logger.warning("Cache notification listener stopped", error=str(e))
+        finally:
+            self._listener = None
+
     async def close(self) -> None:
         """Close Redis connection."""
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
         if self.redis:
             await self.redis.aclose()
+            self.redis = None
             logger.info("Closed Redis cache connection")
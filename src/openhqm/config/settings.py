@@ -15,6 +15,11 @@ class ServerSettings(BaseSettings):
     port: int = Field(default=8000, description="Server port", ge=0, le=65535)
     workers: int = Field(default=4, description="Number of Uvicorn workers")
     reload: bool = Field(default=False, description="Enable auto-reload")
+    gzip_min_size: int = Field(
+        default=1024,
+        description="Gzip responses at least this many bytes long (0 = disabled)",
+        ge=0,
+    )
 
 
 class QueueSettings(BaseSettings):
@@ -58,6 +63,21 @@ class QueueSettings(BaseSettings):
     gcp_project_id: str = Field(default="", description="GCP project ID")
     gcp_credentials_path: str = Field(default="", description="Path to GCP service account JSON")
     gcp_max_messages: int = Field(default=10, description="Max messages to pull per request")
+    gcp_parallel_pull_count: int = Field(
+        default=1, ge=1, description="Concurrent streaming pulls per subscription"
+    )
+    gcp_max_bytes: int = Field(
+        default=10 * 1024 * 1024, description="Max bytes of outstanding messages per stream"
+    )
+    gcp_max_lease_duration: int = Field(
+        default=600, description="Max seconds a message lease is extended for"
+    )
+    gcp_max_lease_extension: int = Field(
+        default=0, description="Max seconds per lease extension (0 = client default)"
+    )
+    gcp_max_concurrency: int = Field(
+        default=0, ge=0, description="Max messages handled at once (0 = gcp_max_messages)"
+    )
 
     # MQTT configuration
     mqtt_broker_host: str = Field(default="localhost", description="MQTT broker hostname")
@@ -84,6 +104,21 @@ class QueueSettings(BaseSettings):
         default="openhqm-responses", description="Response queue/topic name"
     )
     dlq_name: str = Field(default="openhqm-dlq", description="Dead letter queue name")
+    publish_batch_size: int = Field(
+        default=1,
+        description="Max submissions sent per publish call (1 = publish each one directly)",
+        ge=1,
+    )
+    publish_linger_ms: int = Field(
+        default=0,
+        description="Time to wait for more submissions before publishing a batch",
+        ge=0,
+    )
+    publish_async: bool = Field(
+        default=False,
+        description="Accept submissions before the broker confirms them "
+        "(failed publishes mark the request FAILED)",
+    )
 
 
 class WorkerSettings(BaseSettings):
@@ -146,6 +181,19 @@ class CacheSettings(BaseSettings):
     redis_url: str = Field(default="redis://localhost:6379", description="Redis connection URL")
     ttl_seconds: int = Field(default=3600, description="Default cache TTL")
     max_connections: int = Field(default=10, description="Maximum connection pool size")
+    local_ttl_ms: int = Field(
+        default=0,
+        description="Serve repeated reads from process memory for this long (0 = disabled)",
+        ge=0,
+    )
+    local_final_ttl_ms: int = Field(
+        default=5000,
+        description="Local lifetime of entries in a final status (with local_ttl_ms set)",
+        ge=0,
+    )
+    local_max_entries: int = Field(
+        default=10_000, description="Maximum entries held in process memory", ge=1
+    )
 
 
 class MonitoringSettings(BaseSettings):
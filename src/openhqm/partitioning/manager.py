@@ -2,15 +2,40 @@
 
 import hashlib
 import time
+import zlib
 from typing import Any
 
 import structlog
 
 from openhqm.partitioning.models import PartitionConfig, PartitionStrategy, SessionInfo
-from openhqm.utils.helpers import get_nested_value
+from openhqm.utils.helpers import get_path_value
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of partition keys whose partition is remembered
+PARTITION_CACHE_SIZE = 65536
+
+
+def _jump_hash(key: int, num_buckets: int) -> int:
+    """Map a key hash to a bucket with jump consistent hashing.
+
+    Lamping & Veach, "A Fast, Minimal Memory, Consistent Hash Algorithm".
+
+    Args:
+        key: Key hash (reduced to 64 bits)
+        num_buckets: Number of buckets
+
+    Returns:
+        Bucket number (0 to num_buckets - 1)
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, candidate = -1, 0
+    while candidate < num_buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
 
 class PartitionManager:
     """Manages partition assignment and session affinity for workers.
@@ -28,9 +53,46 @@ class PartitionManager:
         """
         self.config = config
         self.worker_id = worker_id
-        self._sessions: dict[str, SessionInfo] = {}
+
+        # Plain attribute copies of the config fields read on the message path
+        self._enabled = config.enabled
+        self._partition_count = config.partition_count
+        self._session_ttl = config.sticky_session_ttl
+        # Session state is kept column-wise. _last_seen is ordered from least to
+        # most recently active, so expired sessions are always at the front
+        self._last_seen: dict[str, float] = {}  # session_id -> monotonic last activity
+        self._msg_count: dict[str, int] = {}  # session_id -> messages seen
+        self._session_partition: dict[str, int] = {}  # session_id -> partition_id
+        self._total_messages = 0  # Sum of _msg_count, kept up to date for stats
         self._partition_assignments: dict[int, str] = {}  # partition_id -> worker_id
-        self._worker_partitions: set[int] = set()  # Partitions owned by this worker
+        # Partitions owned by this worker; replaced wholesale on reassignment so
+        # readers never see a half-built set
+        self._worker_partitions: frozenset[int] = frozenset()
+        self._partition_cache: dict[str, int] = {}  # partition key -> partition_id
+
+        # The strategy is fixed, so pick its assignment function once
+        self._assign_partition = (
+            self._assign_round_robin
+            if config.strategy == PartitionStrategy.ROUND_ROBIN
+            else self._assign_by_hash
+        )
+
+        # Field paths are fixed, so split them once rather than per message
+        self._partition_key_path = tuple(config.partition_key_field.split("."))
+        self._session_key_path = tuple(config.session_key_field.split("."))
+
+        # Both default paths live under "metadata"; classify() walks the shared
+        # prefix once and reads each key from there
+        prefix_len = 0
+        for partition_segment, session_segment in zip(
+            self._partition_key_path, self._session_key_path, strict=False
+        ):
+            if partition_segment != session_segment:
+                break
+            prefix_len += 1
+        self._common_key_prefix = self._partition_key_path[:prefix_len]
+        self._partition_key_tail = self._partition_key_path[prefix_len:]
+        self._session_key_tail = self._session_key_path[prefix_len:]
 
         logger.info(
             "Partition manager initialized",
@@ -42,16 +104,27 @@ class PartitionManager:
     def _hash_key(self, key: str) -> int:
         """Generate consistent hash for a key.
 
+        Partitioning is not a security boundary, so keys are hashed with
+        CRC-32 by default; ``secure_hash`` switches to SHA-256 for keys an
+        attacker could choose. Both are stable across processes and hosts,
+        which every worker must agree on.
+
         Args:
             key: Key to hash
 
         Returns:
             Hash value as integer
         """
-        return int(hashlib.sha256(key.encode()).hexdigest(), 16)
+        if self.config.secure_hash:
+            return int.from_bytes(hashlib.sha256(key.encode()).digest())
+        return zlib.crc32(key.encode())
 
-    def _assign_partition(self, key: str) -> int:
-        """Assign partition based on key and strategy.
+    def _assign_by_hash(self, key: str) -> int:
+        """Assign partition by consistent hashing of the key.
+
+        Used by the HASH, KEY and STICKY strategies. Keys are mapped with jump
+        consistent hashing, so changing ``partition_count`` from n to n + 1
+        moves only about 1/(n + 1) of the keys instead of nearly all of them.
 
         Args:
             key: Partition key
@@ -59,22 +132,28 @@ class PartitionManager:
         Returns:
             Partition ID (0 to partition_count - 1)
         """
-        if self.config.strategy == PartitionStrategy.HASH:
-            hash_value = self._hash_key(key)
-            return hash_value % self.config.partition_count
+        # Memoized, since the result only depends on the key for a given config
+        partition_id = self._partition_cache.get(key)
+        if partition_id is None:
+            partition_id = _jump_hash(self._hash_key(key), self._partition_count)
+            if len(self._partition_cache) >= PARTITION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._partition_cache[next(iter(self._partition_cache))]
+            self._partition_cache[key] = partition_id
+        return partition_id
 
-        elif self.config.strategy in [PartitionStrategy.STICKY, PartitionStrategy.KEY]:
-            # Consistent hashing for sticky sessions
-            hash_value = self._hash_key(key)
-            return hash_value % self.config.partition_count
+    def _assign_round_robin(self, key: str) -> int:
+        """Assign partition for the ROUND_ROBIN strategy.
 
-        elif self.config.strategy == PartitionStrategy.ROUND_ROBIN:
-            # Round-robin based on current time (not truly round-robin across workers)
-            return int(time.time() * 1000) % self.config.partition_count
+        Round-robin based on current time (not truly round-robin across workers).
 
-        else:
-            # Default to hash
-            return self._hash_key(key) % self.config.partition_count
+        Args:
+            key: Partition key (unused)
+
+        Returns:
+            Partition ID (0 to partition_count - 1)
+        """
+        return time.monotonic_ns() // 1_000_000 % self._partition_count
 
     def assign_worker_partitions(self, worker_count: int, worker_index: int):
         """Assign partitions to this worker based on worker count.
@@ -83,14 +162,14 @@ class PartitionManager:
             worker_count: Total number of workers
             worker_index: This worker's index (0-based)
         """
-        self._worker_partitions.clear()
-
         # Distribute partitions across workers
-        for partition_id in range(self.config.partition_count):
-            assigned_worker_index = partition_id % worker_count
-            if assigned_worker_index == worker_index:
-                self._worker_partitions.add(partition_id)
-                self._partition_assignments[partition_id] = self.worker_id
+        self._worker_partitions = frozenset(
+            partition_id
+            for partition_id in range(self._partition_count)
+            if partition_id % worker_count == worker_index
+        )
+        for partition_id in self._worker_partitions:
+            self._partition_assignments[partition_id] = self.worker_id
 
         logger.info(
             "Worker partitions assigned",
@@ -106,8 +185,8 @@ class PartitionManager:
         Args:
             partitions: Set of partition IDs to assign to this worker
         """
-        self._worker_partitions = set(partitions)
-        for partition_id in partitions:
+        self._worker_partitions = frozenset(partitions)
+        for partition_id in self._worker_partitions:
             self._partition_assignments[partition_id] = self.worker_id
 
         logger.info(
@@ -125,7 +204,7 @@ class PartitionManager:
         Returns:
             Partition key or None if not found
         """
-        return get_nested_value(message, self.config.partition_key_field)
+        return get_path_value(message, self._partition_key_path)
 
     def get_session_id(self, message: dict[str, Any]) -> str | None:
         """Extract session ID from message.
@@ -136,37 +215,41 @@ class PartitionManager:
         Returns:
             Session ID or None if not found
         """
-        return get_nested_value(message, self.config.session_key_field)
+        return get_path_value(message, self._session_key_path)
 
-    def get_partition_for_message(self, message: dict[str, Any]) -> int | None:
-        """Determine partition for a message.
+    def classify(self, message: dict[str, Any]) -> tuple[int | None, str | None, bool]:
+        """Work out a message's partition, session and ownership in one pass.
 
         Args:
             message: Queue message
 
         Returns:
-            Partition ID or None if partitioning is disabled
+            Tuple of (partition ID or None, session ID or None, whether this
+            worker should process the message)
         """
-        if not self.config.enabled:
-            return None
+        if not self._enabled:
+            return None, None, True  # Process all messages if partitioning disabled
 
-        # Try partition key first
-        partition_key = self.get_partition_key(message)
-        if not partition_key:
-            # Try session ID as fallback
-            partition_key = self.get_session_id(message)
+        # Partition key first, session ID as fallback
+        node = get_path_value(message, self._common_key_prefix)
+        session_id = get_path_value(node, self._session_key_tail)
+        partition_key = get_path_value(node, self._partition_key_tail) or session_id
 
         if not partition_key:
             logger.warning(
                 "No partition key found in message",
                 correlation_id=message.get("correlation_id"),
             )
-            return None
+            return None, session_id, True  # Process if no partition assigned
 
-        return self._assign_partition(partition_key)
+        partition_id = self._assign_partition(partition_key)
+        return partition_id, session_id, partition_id in self._worker_partitions
 
-    def should_process_message(self, message: dict[str, Any]) -> bool:
-        """Check if this worker should process the message.
+    def claim_message(self, message: dict[str, Any]) -> bool:
+        """Check if this worker should process a message, tracking its session if so.
+
+        Equivalent to :meth:`should_process_message` followed by
+        :meth:`track_session` for owned messages, with a single lookup.
 
         Args:
             message: Queue message
@@ -174,14 +257,32 @@ class PartitionManager:
         Returns:
             True if this worker owns the partition for this message
         """
-        if not self.config.enabled:
-            return True  # Process all messages if partitioning disabled
+        partition_id, session_id, owned = self.classify(message)
+        if owned and session_id and partition_id is not None:
+            self._record_session(session_id, partition_id)
+        return owned
 
-        partition_id = self.get_partition_for_message(message)
-        if partition_id is None:
-            return True  # Process if no partition assigned
+    def get_partition_for_message(self, message: dict[str, Any]) -> int | None:
+        """Determine partition for a message.
 
-        return partition_id in self._worker_partitions
+        Args:
+            message: Queue message
+
+        Returns:
+            Partition ID or None if partitioning is disabled
+        """
+        return self.classify(message)[0]
+
+    def should_process_message(self, message: dict[str, Any]) -> bool:
+        """Check if this worker should process the message.
+
+        Args:
+            message: Queue message
+
+        Returns:
+            True if this worker owns the partition for this message
+        """
+        return self.classify(message)[2]
 
     def track_session(self, message: dict[str, Any]):
         """Track session activity for sticky sessions.
@@ -189,56 +290,71 @@ class PartitionManager:
         Args:
             message: Queue message
         """
-        session_id = self.get_session_id(message)
-        if not session_id:
-            return
+        partition_id, session_id, _ = self.classify(message)
+        if session_id and partition_id is not None:
+            self._record_session(session_id, partition_id)
 
-        partition_id = self.get_partition_for_message(message)
-        if partition_id is None:
-            return
-
-        now = time.time()
-
-        if session_id in self._sessions:
-            # Update existing session
-            session = self._sessions[session_id]
-            session.last_seen = now
-            session.message_count += 1
-        else:
-            # Create new session
-            self._sessions[session_id] = SessionInfo(
-                session_id=session_id,
-                partition_id=partition_id,
-                worker_id=self.worker_id,
-                last_seen=now,
-                message_count=1,
-            )
+    def _record_session(self, session_id: str, partition_id: int):
+        """Record activity for a session.
 
-        logger.debug(
-            "Session tracked",
-            session_id=session_id,
-            partition_id=partition_id,
-            message_count=self._sessions[session_id].message_count,
-        )
+        Args:
+            session_id: Session identifier
+            partition_id: Partition the session maps to
+        """
+        # Re-insert to move the session to the most recently active end
+        self._last_seen.pop(session_id, None)
+        self._last_seen[session_id] = time.monotonic()
+        message_count = self._msg_count.get(session_id, 0) + 1
+        self._msg_count[session_id] = message_count
+        self._total_messages += 1
+
+        # Log new sessions only; per-message counts are in get_session_stats()
+        if message_count == 1:
+            self._session_partition[session_id] = partition_id
+            logger.debug("Session started", session_id=session_id, partition_id=partition_id)
 
     def cleanup_expired_sessions(self):
         """Remove expired sessions based on TTL."""
-        if self.config.sticky_session_ttl == 0:
+        if self._session_ttl == 0:
             return  # No expiration
 
-        now = time.time()
+        # Sessions are in activity order, so stop at the first live one; the
+        # cost scales with the number of expired sessions, not all of them
+        cutoff = time.monotonic() - self._session_ttl
         expired = []
-
-        for session_id, session in self._sessions.items():
-            if now - session.last_seen > self.config.sticky_session_ttl:
-                expired.append(session_id)
+        for session_id, last_seen in self._last_seen.items():
+            if last_seen >= cutoff:
+                break
+            expired.append(session_id)
 
         for session_id in expired:
-            del self._sessions[session_id]
+            del self._last_seen[session_id]
+            del self._session_partition[session_id]
+            self._total_messages -= self._msg_count.pop(session_id)
 
         if expired:
             logger.info("Expired sessions cleaned up", count=len(expired))
 
+    def get_session(self, session_id: str) -> SessionInfo | None:
+        """Get information about a tracked session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session information or None if the session is not tracked
+        """
+        last_seen = self._last_seen.get(session_id)
+        if last_seen is None:
+            return None
+        return SessionInfo(
+            session_id=session_id,
+            partition_id=self._session_partition[session_id],
+            worker_id=self.worker_id,
+            last_seen=last_seen,
+            message_count=self._msg_count[session_id],
+        )
+
     def get_session_stats(self) -> dict[str, Any]:
         """Get statistics about active sessions.
 
@@ -246,10 +362,10 @@ class PartitionManager:
             Dict with session statistics
         """
         return {
-            "active_sessions": len(self._sessions),
+            "active_sessions": len(self._last_seen),
             "assigned_partitions": len(self._worker_partitions),
             "partition_ids": sorted(self._worker_partitions),
-            "total_messages": sum(s.message_count for s in self._sessions.values()),
+            "total_messages": self._total_messages,
         }
 
     def get_stats(self) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 """Data models for partitioning configuration."""
 
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Literal
 
@@ -21,8 +22,12 @@ class PartitionConfig(BaseModel):
     Partitioning ensures messages with the same partition key
     are always processed by the same worker instance, enabling
     session affinity for legacy applications.
+
+    Frozen: partition managers copy fields out of it at construction time.
     """
 
+    model_config = {"frozen": True}
+
     enabled: bool = Field(default=False, description="Enable partitioning")
 
     strategy: PartitionStrategy = Field(
@@ -46,6 +51,12 @@ class PartitionConfig(BaseModel):
         description="Message field path to use as session identifier",
     )
 
+    secure_hash: bool = Field(
+        default=False,
+        description="Hash partition keys with SHA-256 instead of CRC-32 "
+        "(slower; only needed if clients may craft keys to skew partitions)",
+    )
+
     rebalance_on_worker_change: bool = Field(
         default=True,
         description="Rebalance partitions when workers join/leave",
@@ -75,11 +86,16 @@ class PartitionConfig(BaseModel):
     )
 
 
-class SessionInfo(BaseModel):
-    """Information about a sticky session."""
+@dataclass(slots=True)
+class SessionInfo:
+    """Information about a sticky session.
+
+    Internal record built by the partition manager, so a plain slotted
+    dataclass rather than a validated model.
+    """
 
-    session_id: str = Field(..., description="Session identifier")
-    partition_id: int = Field(..., description="Assigned partition")
-    worker_id: str = Field(..., description="Worker handling this session")
-    last_seen: float = Field(..., description="Timestamp of last activity")
-    message_count: int = Field(default=0, description="Messages processed in this session")
+    session_id: str  # Session identifier
+    partition_id: int  # Assigned partition
+    worker_id: str  # Worker handling this session
+    last_seen: float  # Monotonic clock time of last activity
+    message_count: int = 0  # Messages processed in this session
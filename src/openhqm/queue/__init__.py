@@ -1,6 +1,24 @@
 """Message queue abstraction layer."""
 
-from openhqm.queue.factory import create_queue
+import importlib
+from typing import Any
+
+from openhqm.queue.factory import QUEUE_BACKENDS, create_queue
 from openhqm.queue.interface import MessageQueueInterface
 
 __all__ = ["MessageQueueInterface", "create_queue"]
+
+# Backend classes are imported on first access (PEP 562), so importing this
+# package never loads a client SDK that is not used
+_LAZY_BACKENDS = {class_name: module for module, class_name in QUEUE_BACKENDS.values()}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a queue backend class the first time it is accessed."""
+    module_path = _LAZY_BACKENDS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,5 @@
 """Azure Event Hubs implementation of message queue."""
 
-import json
 import time
 from collections.abc import Callable
 from typing import Any
@@ -9,10 +8,27 @@ import structlog
 
 from openhqm.exceptions import QueueError
 from openhqm.queue.interface import MessageQueueInterface, QueueMessage
+from openhqm.utils import serialization
 
 logger = structlog.get_logger(__name__)
 
 
+def _event_data(body: bytes):
+    """Wrap a payload in an ``EventData`` (imported lazily with the SDK)."""
+    from azure.eventhub import EventData
+
+    return EventData(body)
+
+
+def _try_add(event_batch, event_data) -> bool:
+    """Add an event to a batch, returning False if the batch has no room for it."""
+    try:
+        event_batch.add(event_data)
+    except ValueError:
+        return False
+    return True
+
+
 class AzureEventHubsQueue(MessageQueueInterface):
     """
     Azure Event Hubs implementation of message queue.
@@ -124,11 +140,9 @@ class AzureEventHubsQueue(MessageQueueInterface):
         Note: Event Hubs doesn't support message priority or delay natively.
         These can be implemented at application level.
         """
-        from azure.eventhub import EventData
-
         try:
             # Create event data
-            event_data = EventData(json.dumps(message))
+            event_data = _event_data(serialization.dumps(message))
 
             # Add custom properties
             if attributes:
@@ -139,11 +153,10 @@ class AzureEventHubsQueue(MessageQueueInterface):
             if priority > 0:
                 event_data.properties["priority"] = str(priority)
 
-            # Send event
-            async with self.producer_client:
-                event_batch = await self.producer_client.create_batch()
-                event_batch.add(event_data)
-                await self.producer_client.send_batch(event_batch)
+            # Send event on the long-lived producer connection opened in connect()
+            event_batch = await self.producer_client.create_batch()
+            event_batch.add(event_data)
+            await self.producer_client.send_batch(event_batch)
 
             # Event Hubs doesn't return message ID, use timestamp as identifier
             message_id = f"eventhub-{time.time()}"
@@ -160,6 +173,82 @@ class AzureEventHubsQueue(MessageQueueInterface):
             logger.error("Failed to publish to Event Hub", error=str(e))
             raise QueueError(f"Failed to publish to Event Hub: {e}") from e
 
+    async def publish_batch(
+        self,
+        queue_name: str,
+        messages: list[dict[str, Any]],
+    ) -> list[bool]:
+        """
+        Publish several messages to Event Hub with as few sends as possible.
+
+        Messages are packed into one ``EventDataBatch``; when it is full it
+        is sent and a new one started. A message too large for an empty
+        batch, or in a batch whose send fails, is reported as unpublished
+        and the remaining messages are still sent.
+
+        Args:
+            queue_name: Target queue name (events go to the configured hub)
+            messages: Message payloads
+
+        Returns:
+            One entry per message, True if it was published successfully
+        """
+        results = [False] * len(messages)
+        event_batch = None
+        batched: list[int] = []
+        for index, message in enumerate(messages):
+            try:
+                event_data = _event_data(serialization.dumps(message))
+            except Exception as e:
+                logger.error("Failed to encode Event Hub message", index=index, error=str(e))
+                continue
+
+            try:
+                if event_batch is None:
+                    event_batch = await self.producer_client.create_batch()
+                if _try_add(event_batch, event_data):
+                    batched.append(index)
+                    continue
+
+                if batched:
+                    # Batch is full: send it and retry this event in a new one
+                    await self._send_batch(event_batch, batched, results)
+                    batched = []
+                    event_batch = None
+                    event_batch = await self.producer_client.create_batch()
+                    if _try_add(event_batch, event_data):
+                        batched.append(index)
+                        continue
+
+                logger.error("Message too large for an Event Hub batch", index=index)
+            except Exception as e:
+                logger.error("Failed to create Event Hub batch", index=index, error=str(e))
+
+        if batched:
+            await self._send_batch(event_batch, batched, results)
+
+        logger.debug(
+            "Published batch to Event Hub",
+            eventhub=self.eventhub_name,
+            size=len(messages),
+        )
+        return results
+
+    async def _send_batch(self, event_batch, indexes: list[int], results: list[bool]) -> None:
+        """Send an event batch, marking its messages as published on success."""
+        try:
+            await self.producer_client.send_batch(event_batch)
+        except Exception as e:
+            logger.error(
+                "Failed to publish batch to Event Hub",
+                size=len(indexes),
+                error=str(e),
+            )
+            return
+
+        for index in indexes:
+            results[index] = True
+
     async def consume(
         self,
         queue_name: str,
@@ -177,7 +266,7 @@ class AzureEventHubsQueue(MessageQueueInterface):
 
             try:
                 # Parse message body
-                body = json.loads(event.body_as_str())
+                body = serialization.loads(b"".join(event.body))
 
                 # Create standardized message
                 message = QueueMessage(
@@ -0,0 +1,178 @@
+"""Coalesce concurrent queue publishes into batched backend calls."""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from openhqm.queue.interface import MessageQueueInterface
+
+logger = structlog.get_logger(__name__)
+
+# A queued message and the future its publisher is waiting on
+_Pending = tuple[dict[str, Any], asyncio.Future[bool]]
+
+
+class PublishBatcher:
+    """
+    Publish messages to a single queue, batching concurrent callers.
+
+    Callers await :meth:`publish` as if it were a direct publish. With a
+    batch size above one, messages are handed to a background flusher that
+    drains whatever has accumulated (up to ``max_batch_size``), optionally
+    lingering ``linger_ms`` for more, and sends them with one
+    ``publish_batch`` call. Each caller's future resolves once its batch has
+    been acknowledged, so a batch of N costs one broker round-trip instead
+    of N.
+
+    A batch size of one disables batching: every message is published
+    directly, without a background task.
+    """
+
+    def __init__(
+        self,
+        queue: MessageQueueInterface,
+        queue_name: str,
+        max_batch_size: int = 1,
+        linger_ms: int = 0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            queue: Queue backend to publish to
+            queue_name: Target queue/topic name
+            max_batch_size: Maximum messages per backend call (1 = no batching)
+            linger_ms: Time to wait for more messages before flushing a batch
+        """
+        self.queue = queue
+        self.queue_name = queue_name
+        self.max_batch_size = max_batch_size
+        self.linger = linger_ms / 1000
+        self._pending: asyncio.Queue[_Pending] = asyncio.Queue()
+        self._flusher: asyncio.Task | None = None
+        self._confirms: set[asyncio.Task] = set()
+
+    async def publish(self, message: dict[str, Any]) -> bool:
+        """
+        Publish a message, sharing a backend call with concurrent callers.
+
+        Args:
+            message: Message payload
+
+        Returns:
+            True if the message was published successfully
+
+        Raises:
+            Exception: Whatever the backend raised for the message's batch
+        """
+        if self.max_batch_size <= 1:
+            # Backends return a message ID, or a falsy value on failure
+            return bool(await self.queue.publish(self.queue_name, message))
+        return await self._enqueue(message)
+
+    def publish_nowait(
+        self,
+        message: dict[str, Any],
+        on_confirm: Callable[[bool], Awaitable[None]],
+    ) -> None:
+        """
+        Publish a message without waiting for the broker to confirm it.
+
+        The confirmation is awaited by a background task, which then calls
+        ``on_confirm`` with whether the message was published. Backend
+        errors count as a failed publish.
+
+        Args:
+            message: Message payload
+            on_confirm: Async callback receiving the publish outcome
+        """
+        if self.max_batch_size <= 1:
+            confirm = self.queue.publish_async(self.queue_name, message)
+        else:
+            confirm = self._enqueue(message)
+
+        task = asyncio.create_task(self._reap(confirm, on_confirm))
+        self._confirms.add(task)
+        task.add_done_callback(self._confirms.discard)
+
+    async def close(self) -> None:
+        """Flush pending messages, wait for confirmations and stop the flusher."""
+        if self._flusher is not None:
+            await self._pending.join()
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+
+        if self._confirms:
+            await asyncio.gather(*self._confirms, return_exceptions=True)
+
+    def _enqueue(self, message: dict[str, Any]) -> asyncio.Future[bool]:
+        """Queue a message for the flusher, starting it on first use."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((message, future))
+        return future
+
+    async def _reap(
+        self,
+        confirm: Awaitable[bool],
+        on_confirm: Callable[[bool], Awaitable[None]],
+    ) -> None:
+        """Wait for a publish confirmation and report its outcome."""
+        try:
+            success = bool(await confirm)
+        except Exception as e:
+            logger.error("Publish failed", queue_name=self.queue_name, error=str(e))
+            success = False
+
+        try:
+            await on_confirm(success)
+        except Exception as e:
+            logger.error("Publish confirmation handler failed", error=str(e))
+
+    def _drain(self, batch: list[_Pending]) -> list[_Pending]:
+        """Move already-queued messages into ``batch`` up to the batch size."""
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._pending.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Background loop: wait for a message, collect a batch, flush it."""
+        while True:
+            batch = [await self._pending.get()]
+            if self.linger:
+                await asyncio.sleep(self.linger)
+            await self._flush(self._drain(batch))
+
+    async def _flush(self, batch: list[_Pending]) -> None:
+        """Publish a batch and resolve its callers' futures."""
+        try:
+            results = await self.queue.publish_batch(
+                self.queue_name, [message for message, _ in batch]
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to publish batch",
+                queue_name=self.queue_name,
+                size=len(batch),
+                error=str(e),
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            for _ in batch:
+                self._pending.task_done()
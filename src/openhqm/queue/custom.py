@@ -1,5 +1,6 @@
 """Custom/plugin queue handler support."""
 
+import functools
 import importlib
 import inspect
 from typing import Any
@@ -12,6 +13,12 @@ from openhqm.queue.interface import MessageQueueInterface
 logger = structlog.get_logger(__name__)
 
 
+@functools.cache
+def _init_params(queue_class: type) -> frozenset[str]:
+    """Get the constructor parameter names of a queue class (excluding self)."""
+    return frozenset(list(inspect.signature(queue_class.__init__).parameters)[1:])
+
+
 class CustomQueueHandler:
     """
     Support for bringing your own queue handler.
@@ -66,8 +73,7 @@ class CustomQueueHandler:
                 )
 
             # Inspect constructor to determine what parameters it accepts
-            sig = inspect.signature(queue_class.__init__)
-            params = list(sig.parameters.keys())[1:]  # Skip 'self'
+            params = _init_params(queue_class)
 
             # Filter config to only include accepted parameters
             filtered_config = {key: value for key, value in config.items() if key in params}
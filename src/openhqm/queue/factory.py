@@ -1,5 +1,8 @@
 """Factory for creating message queue instances."""
 
+import importlib
+from typing import Any
+
 import structlog
 
 from openhqm.config import settings
@@ -8,63 +11,106 @@ from openhqm.queue.interface import MessageQueueFactory, MessageQueueInterface
 
 logger = structlog.get_logger(__name__)
 
+# Queue type -> (module, class) of its implementation. Only the configured
+# backend is imported, so unused client SDKs are never loaded.
+QUEUE_BACKENDS: dict[str, tuple[str, str]] = {
+    "redis": ("openhqm.queue.redis_queue", "RedisQueue"),
+    "kafka": ("openhqm.queue.kafka_queue", "KafkaQueue"),
+    "sqs": ("openhqm.queue.sqs_queue", "SQSQueue"),
+    "azure_eventhubs": ("openhqm.queue.azure_eventhubs", "AzureEventHubsQueue"),
+    "gcp_pubsub": ("openhqm.queue.gcp_pubsub", "GCPPubSubQueue"),
+    "mqtt": ("openhqm.queue.mqtt", "MQTTQueue"),
+}
 
-def register_all_queues():
-    """Register all available queue implementations."""
 
-    # Redis Streams
-    try:
-        from openhqm.queue.redis_queue import RedisQueue
+def register_queue(queue_type: str) -> None:
+    """
+    Import and register the implementation of a queue type.
 
-        MessageQueueFactory.register("redis", RedisQueue)
-        logger.debug("Registered Redis queue")
-    except ImportError as e:
-        logger.warning("Redis queue not available", error=str(e))
+    Args:
+        queue_type: Queue type identifier (e.g., "redis", "kafka")
 
-    # Apache Kafka
-    try:
-        from openhqm.queue.kafka_queue import KafkaQueue
+    Raises:
+        QueueError: If the queue type is unknown or its module cannot be imported
+    """
+    if queue_type in MessageQueueFactory.list_types():
+        return
 
-        MessageQueueFactory.register("kafka", KafkaQueue)
-        logger.debug("Registered Kafka queue")
-    except ImportError as e:
-        logger.warning("Kafka queue not available", error=str(e))
+    backend = QUEUE_BACKENDS.get(queue_type)
+    if backend is None:
+        raise QueueError(f"No configuration found for queue type: {queue_type}")
 
-    # AWS SQS
+    module_path, class_name = backend
     try:
-        from openhqm.queue.sqs_queue import SQSQueue
-
-        MessageQueueFactory.register("sqs", SQSQueue)
-        logger.debug("Registered SQS queue")
+        queue_class = getattr(importlib.import_module(module_path), class_name)
     except ImportError as e:
-        logger.warning("SQS queue not available", error=str(e))
+        logger.warning("Queue backend not available", type=queue_type, error=str(e))
+        raise QueueError(f"Queue type '{queue_type}' is not available: {e}") from e
 
-    # Azure Event Hubs
-    try:
-        from openhqm.queue.azure_eventhubs import AzureEventHubsQueue
+    MessageQueueFactory.register(queue_type, queue_class)
+    logger.debug("Registered queue", type=queue_type)
 
-        MessageQueueFactory.register("azure_eventhubs", AzureEventHubsQueue)
-        logger.debug("Registered Azure Event Hubs queue")
-    except ImportError as e:
-        logger.warning("Azure Event Hubs queue not available", error=str(e))
 
-    # GCP Pub/Sub
-    try:
-        from openhqm.queue.gcp_pubsub import GCPPubSubQueue
+def _queue_config(queue_type: str) -> dict[str, Any]:
+    """
+    Build constructor arguments for a queue type from settings.
 
-        MessageQueueFactory.register("gcp_pubsub", GCPPubSubQueue)
-        logger.debug("Registered GCP Pub/Sub queue")
-    except ImportError as e:
-        logger.warning("GCP Pub/Sub queue not available", error=str(e))
+    Args:
+        queue_type: Queue type identifier
 
-    # MQTT
-    try:
-        from openhqm.queue.mqtt import MQTTQueue
+    Returns:
+        Keyword arguments for the queue class
 
-        MessageQueueFactory.register("mqtt", MQTTQueue)
-        logger.debug("Registered MQTT queue")
-    except ImportError as e:
-        logger.warning("MQTT queue not available", error=str(e))
+    Raises:
+        QueueError: If the queue type has no configuration
+    """
+    queue = settings.queue
+    match queue_type:
+        case "redis":
+            return {
+                "url": queue.redis_url,
+                "max_connections": settings.cache.max_connections,
+            }
+        case "kafka":
+            return {
+                "bootstrap_servers": queue.kafka_bootstrap_servers.split(","),
+                "consumer_group": queue.kafka_consumer_group,
+                "topics": queue.kafka_topics,
+            }
+        case "sqs":
+            return {
+                "region_name": queue.sqs_region,
+                "queue_url": queue.sqs_queue_url,
+            }
+        case "azure_eventhubs":
+            return {
+                "connection_string": queue.azure_eventhubs_connection_string,
+                "eventhub_name": queue.azure_eventhubs_name,
+                "consumer_group": queue.azure_eventhubs_consumer_group,
+                "checkpoint_store_connection": queue.azure_eventhubs_checkpoint_store or None,
+            }
+        case "gcp_pubsub":
+            return {
+                "project_id": queue.gcp_project_id,
+                "credentials_path": queue.gcp_credentials_path or None,
+                "max_messages": queue.gcp_max_messages,
+                "parallel_pull_count": queue.gcp_parallel_pull_count,
+                "max_bytes": queue.gcp_max_bytes,
+                "max_lease_duration": queue.gcp_max_lease_duration,
+                "max_lease_extension": queue.gcp_max_lease_extension,
+                "max_concurrency": queue.gcp_max_concurrency or None,
+            }
+        case "mqtt":
+            return {
+                "broker_host": queue.mqtt_broker_host,
+                "broker_port": queue.mqtt_broker_port,
+                "username": queue.mqtt_username or None,
+                "password": queue.mqtt_password or None,
+                "qos": queue.mqtt_qos,
+                "client_id": queue.mqtt_client_id or None,
+            }
+        case _:
+            raise QueueError(f"No configuration found for queue type: {queue_type}")
 
 
 async def create_queue() -> MessageQueueInterface:
@@ -101,51 +147,14 @@ async def create_queue() -> MessageQueueInterface:
         await queue.connect()
         return queue
 
-    # Register all available queues
-    register_all_queues()
-
-    # Map queue type to configuration
-    queue_configs = {
-        "redis": {
-            "url": settings.queue.redis_url,
-            "max_connections": settings.cache.max_connections,
-        },
-        "kafka": {
-            "bootstrap_servers": settings.queue.kafka_bootstrap_servers.split(","),
-            "consumer_group": settings.queue.kafka_consumer_group,
-            "topics": settings.queue.kafka_topics,
-        },
-        "sqs": {
-            "region_name": settings.queue.sqs_region,
-            "queue_url": settings.queue.sqs_queue_url,
-        },
-        "azure_eventhubs": {
-            "connection_string": settings.queue.azure_eventhubs_connection_string,
-            "eventhub_name": settings.queue.azure_eventhubs_name,
-            "consumer_group": settings.queue.azure_eventhubs_consumer_group,
-            "checkpoint_store_connection": settings.queue.azure_eventhubs_checkpoint_store or None,
-        },
-        "gcp_pubsub": {
-            "project_id": settings.queue.gcp_project_id,
-            "credentials_path": settings.queue.gcp_credentials_path or None,
-            "max_messages": settings.queue.gcp_max_messages,
-        },
-        "mqtt": {
-            "broker_host": settings.queue.mqtt_broker_host,
-            "broker_port": settings.queue.mqtt_broker_port,
-            "username": settings.queue.mqtt_username or None,
-            "password": settings.queue.mqtt_password or None,
-            "qos": settings.queue.mqtt_qos,
-            "client_id": settings.queue.mqtt_client_id or None,
-        },
-    }
-
-    config = queue_configs.get(queue_type)
-    if not config:
-        raise QueueError(f"No configuration found for queue type: {queue_type}")
+    # Import only the configured backend
+    register_queue(queue_type)
+    queue_class = MessageQueueFactory.get_class(queue_type)
+
+    config = _queue_config(queue_type)
 
     try:
-        queue = MessageQueueFactory.create(queue_type, **config)
+        queue = queue_class(**config)
         await queue.connect()
         logger.info("Queue connected successfully", type=queue_type)
         return queue
@@ -1,6 +1,6 @@
 """Google Cloud Pub/Sub implementation of message queue."""
 
-import json
+import asyncio
 import time
 from collections.abc import Callable
 from typing import Any
@@ -9,9 +9,16 @@ import structlog
 
 from openhqm.exceptions import QueueError
 from openhqm.queue.interface import MessageQueueInterface, QueueMessage
+from openhqm.utils import serialization
 
 logger = structlog.get_logger(__name__)
 
+# Publisher client batching: messages published concurrently are sent in one
+# RPC once any limit is reached
+PUBLISH_BATCH_MAX_MESSAGES = 100
+PUBLISH_BATCH_MAX_BYTES = 1024 * 1024
+PUBLISH_BATCH_MAX_LATENCY = 0.01  # seconds
+
 
 class GCPPubSubQueue(MessageQueueInterface):
     """
@@ -30,6 +37,11 @@ class GCPPubSubQueue(MessageQueueInterface):
         project_id: str,
         credentials_path: str | None = None,
         max_messages: int = 10,
+        parallel_pull_count: int = 1,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_lease_duration: int = 600,
+        max_lease_extension: int = 0,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize GCP Pub/Sub queue.
@@ -38,15 +50,27 @@ class GCPPubSubQueue(MessageQueueInterface):
             project_id: GCP project ID
             credentials_path: Path to service account credentials JSON
             max_messages: Maximum messages to pull per request
+            parallel_pull_count: Number of concurrent streaming pulls per subscription
+            max_bytes: Maximum bytes of outstanding messages per streaming pull
+            max_lease_duration: Maximum seconds to keep extending a message's lease
+            max_lease_extension: Maximum seconds per lease extension (0 = client default)
+            max_concurrency: Maximum messages handled at once, across all streaming
+                pulls (defaults to max_messages)
         """
         self.project_id = project_id
         self.credentials_path = credentials_path
         self.max_messages = max_messages
+        self.parallel_pull_count = parallel_pull_count
+        self.max_bytes = max_bytes
+        self.max_lease_duration = max_lease_duration
+        self.max_lease_extension = max_lease_extension
+        self._handler_slots = asyncio.Semaphore(max_concurrency or max_messages)
 
         self.publisher = None
         self.subscriber = None
         self._subscriptions = {}
         self._running = False
+        self._topic_paths: dict[str, str] = {}  # topic name -> resource path
 
     async def connect(self) -> None:
         """Establish connection to GCP Pub/Sub."""
@@ -63,7 +87,14 @@ class GCPPubSubQueue(MessageQueueInterface):
                 )
 
             # Create publisher and subscriber clients
-            self.publisher = pubsub_v1.PublisherClient(credentials=credentials)
+            self.publisher = pubsub_v1.PublisherClient(
+                batch_settings=pubsub_v1.types.BatchSettings(
+                    max_messages=PUBLISH_BATCH_MAX_MESSAGES,
+                    max_bytes=PUBLISH_BATCH_MAX_BYTES,
+                    max_latency=PUBLISH_BATCH_MAX_LATENCY,
+                ),
+                credentials=credentials,
+            )
             self.subscriber = pubsub_v1.SubscriberClient(credentials=credentials)
 
             logger.info("Connected to GCP Pub/Sub", project=self.project_id)
@@ -83,8 +114,9 @@ class GCPPubSubQueue(MessageQueueInterface):
 
         try:
             # Cancel all subscriptions
-            for future in self._subscriptions.values():
-                future.cancel()
+            for futures in self._subscriptions.values():
+                for future in futures:
+                    future.cancel()
 
             self._subscriptions.clear()
             logger.info("Disconnected from GCP Pub/Sub")
@@ -103,23 +135,15 @@ class GCPPubSubQueue(MessageQueueInterface):
         """
         Publish a message to Pub/Sub topic.
 
+        Waits for the publish without blocking the event loop, so concurrent
+        publishes share the client's batches.
+
         Note: Pub/Sub doesn't support message delay natively.
         """
         try:
-            topic_path = self.publisher.topic_path(self.project_id, queue_name)
-
-            # Encode message as JSON
-            data = json.dumps(message).encode("utf-8")
-
-            # Prepare attributes
-            msg_attributes = attributes or {}
-            if priority > 0:
-                msg_attributes["priority"] = str(priority)
-            msg_attributes["timestamp"] = str(time.time())
-
-            # Publish message
-            future = self.publisher.publish(topic_path, data, **msg_attributes)
-            message_id = future.result()  # Block until published
+            message_id = await asyncio.wrap_future(
+                self._submit(queue_name, message, str(time.time()), priority, attributes)
+            )
 
             logger.debug(
                 "Published message to Pub/Sub",
@@ -133,6 +157,81 @@ class GCPPubSubQueue(MessageQueueInterface):
             logger.error("Failed to publish to Pub/Sub", error=str(e))
             raise QueueError(f"Failed to publish to Pub/Sub: {e}") from e
 
+    async def publish_batch(
+        self,
+        queue_name: str,
+        messages: list[dict[str, Any]],
+    ) -> list[bool]:
+        """
+        Publish several messages to a Pub/Sub topic.
+
+        All messages are handed to the publisher client before waiting, so
+        they go out in as few RPCs as its batch settings allow.
+
+        Args:
+            queue_name: Topic name
+            messages: Message payloads
+
+        Returns:
+            One entry per message, True if it was published successfully
+        """
+        # One timestamp for the whole batch; formatting a float per message is
+        # a noticeable share of the per-message cost
+        timestamp = str(time.time())
+        futures = []
+        for message in messages:
+            try:
+                futures.append(asyncio.wrap_future(self._submit(queue_name, message, timestamp)))
+            except Exception as e:
+                logger.error("Failed to publish to Pub/Sub", error=str(e))
+                futures.append(None)
+
+        results = await asyncio.gather(
+            *(future for future in futures if future is not None), return_exceptions=True
+        )
+        outcomes = iter(results)
+        return [
+            future is not None and not isinstance(next(outcomes), BaseException)
+            for future in futures
+        ]
+
+    def _submit(
+        self,
+        queue_name: str,
+        message: dict[str, Any],
+        timestamp: str,
+        priority: int = 0,
+        attributes: dict[str, str] | None = None,
+    ):
+        """Hand a message to the publisher client, returning its publish future."""
+        topic_path = self._topic_path(queue_name)
+
+        # Encode message as JSON
+        data = serialization.dumps(message)
+
+        # Common case: no caller attributes, so skip building a dict to unpack
+        if not attributes and priority <= 0:
+            return self.publisher.publish(topic_path, data, timestamp=timestamp)
+
+        # Copy so the caller's attributes are not modified
+        msg_attributes = dict(attributes) if attributes else {}
+        if priority > 0:
+            msg_attributes["priority"] = str(priority)
+        msg_attributes["timestamp"] = timestamp
+
+        return self.publisher.publish(topic_path, data, **msg_attributes)
+
+    def _topic_path(self, topic: str) -> str:
+        """Get a topic's resource path, formatting it once per topic."""
+        topic_path = self._topic_paths.get(topic)
+        if topic_path is None:
+            topic_path = self._topic_paths[topic] = f"projects/{self.project_id}/topics/{topic}"
+        return topic_path
+
+    def _subscription_path(self, subscription: str) -> str:
+        """Get a subscription's resource path."""
+        return f"projects/{self.project_id}/subscriptions/{subscription}"
+
     async def consume(
         self,
         queue_name: str,
@@ -145,20 +244,22 @@ class GCPPubSubQueue(MessageQueueInterface):
 
         Note: queue_name should be the subscription name, not topic name.
         """
-        import asyncio
-
         self._running = True
-        subscription_path = self.subscriber.subscription_path(self.project_id, queue_name)
+        subscription_path = self._subscription_path(queue_name)
+
+        # The subscriber invokes callbacks on its own threads, so handlers are
+        # handed back to this loop
+        loop = asyncio.get_running_loop()
 
         def callback(message):
-            """Message callback for Pub/Sub."""
+            """Message callback for Pub/Sub (runs on a subscriber thread)."""
             if not self._running:
                 message.nack()
                 return
 
             try:
                 # Parse message body
-                body = json.loads(message.data.decode("utf-8"))
+                body = serialization.loads(message.data)
 
                 # Create standardized message
                 queue_message = QueueMessage(
@@ -170,25 +271,43 @@ class GCPPubSubQueue(MessageQueueInterface):
                     raw_message=message,
                 )
 
-                # Process message asynchronously
-                asyncio.create_task(self._handle_message(handler, queue_message, message))
+                # Process message asynchronously on the consumer's event loop
+                asyncio.run_coroutine_threadsafe(
+                    self._handle_message(handler, queue_message, message), loop
+                )
 
             except Exception as e:
                 logger.error("Error processing Pub/Sub message", error=str(e))
                 message.nack()
 
+        from google.cloud import pubsub_v1
+
+        # Bound what each stream holds so a busy subscriber cannot hoard the
+        # backlog while new subscribers sit idle
+        flow_control = pubsub_v1.types.FlowControl(
+            max_messages=self.max_messages,
+            max_bytes=self.max_bytes,
+            max_lease_duration=self.max_lease_duration,
+            max_duration_per_lease_extension=self.max_lease_extension,
+        )
+
         try:
-            # Start streaming pull
-            streaming_pull_future = self.subscriber.subscribe(
-                subscription_path,
-                callback=callback,
-                flow_control={"max_messages": self.max_messages},
-            )
+            # Start streaming pulls; Pub/Sub spreads messages across the streams
+            streaming_pull_futures = [
+                self.subscriber.subscribe(
+                    subscription_path,
+                    callback=callback,
+                    flow_control=flow_control,
+                )
+                for _ in range(self.parallel_pull_count)
+            ]
 
-            self._subscriptions[queue_name] = streaming_pull_future
+            self._subscriptions[queue_name] = streaming_pull_futures
 
             # Keep alive
-            await asyncio.get_event_loop().run_in_executor(None, streaming_pull_future.result)
+            await asyncio.gather(
+                *(asyncio.to_thread(future.result) for future in streaming_pull_futures)
+            )
 
         except Exception as e:
             logger.error("Error consuming from Pub/Sub", error=str(e))
@@ -197,7 +316,8 @@ class GCPPubSubQueue(MessageQueueInterface):
     async def _handle_message(self, handler, queue_message, pubsub_message):
         """Handle message processing and acknowledgment."""
         try:
-            await handler(queue_message)
+            async with self._handler_slots:
+                await handler(queue_message)
             pubsub_message.ack()
         except Exception as e:
             logger.error("Handler failed", error=str(e))
@@ -229,19 +349,10 @@ class GCPPubSubQueue(MessageQueueInterface):
         """
         Get approximate number of messages in subscription.
 
-        Note: This requires the Monitoring API and may have quota limits.
+        Note: Pub/Sub doesn't expose subscription depth through its own API
+        (it is a Cloud Monitoring metric), so this always returns 0.
         """
-        try:
-            subscription_path = self.subscriber.subscription_path(self.project_id, queue_name)
-            self.subscriber.get_subscription(request={"subscription": subscription_path})
-
-            # Get approximate message count (not real-time)
-            # This is a rough estimate
-            return 0  # Pub/Sub doesn't provide exact depth
-
-        except Exception as e:
-            logger.warning("Failed to get queue depth", error=str(e))
-            return 0
+        return 0
 
     async def create_queue(self, queue_name: str, **kwargs) -> bool:
         """
@@ -255,7 +366,7 @@ class GCPPubSubQueue(MessageQueueInterface):
             from google.api_core.exceptions import AlreadyExists
 
             # Create topic
-            topic_path = self.publisher.topic_path(self.project_id, queue_name)
+            topic_path = self._topic_path(queue_name)
             try:
                 self.publisher.create_topic(request={"name": topic_path})
                 logger.info("Created Pub/Sub topic", topic=queue_name)
@@ -265,9 +376,7 @@ class GCPPubSubQueue(MessageQueueInterface):
             # Create subscription if requested
             if kwargs.get("create_subscription", True):
                 subscription_name = f"{queue_name}-subscription"
-                subscription_path = self.subscriber.subscription_path(
-                    self.project_id, subscription_name
-                )
+                subscription_path = self._subscription_path(subscription_name)
                 try:
                     self.subscriber.create_subscription(
                         request={"name": subscription_path, "topic": topic_path}
@@ -10,13 +10,14 @@ Standardized interface supporting multiple queue backends:
 - Custom implementations
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueMessage:
     """Standardized queue message structure."""
 
@@ -85,6 +86,51 @@ class MessageQueueInterface(ABC):
         """
         pass
 
+    def publish_async(
+        self,
+        queue_name: str,
+        message: dict[str, Any],
+    ) -> asyncio.Future[bool]:
+        """
+        Start publishing a message without waiting for the broker to confirm it.
+
+        Backends with native asynchronous confirms (e.g. producer send
+        futures) should override this; the default runs ``publish`` as a
+        task. Must be called from a running event loop.
+
+        Args:
+            queue_name: Target queue/topic name
+            message: Message payload as dictionary
+
+        Returns:
+            Future resolving to True once the message is confirmed
+        """
+        return asyncio.ensure_future(self.publish(queue_name, message))
+
+    async def publish_batch(
+        self,
+        queue_name: str,
+        messages: list[dict[str, Any]],
+    ) -> list[bool]:
+        """
+        Publish several messages to the specified queue.
+
+        Backends that can send many messages in one round-trip should
+        override this; the default publishes each message concurrently.
+
+        Args:
+            queue_name: Target queue/topic name
+            messages: Message payloads as dictionaries
+
+        Returns:
+            One entry per message, True if it was published successfully
+        """
+        results = await asyncio.gather(
+            *(self.publish(queue_name, message) for message in messages),
+            return_exceptions=True,
+        )
+        return [bool(result) and not isinstance(result, BaseException) for result in results]
+
     @abstractmethod
     async def consume(
         self,
@@ -245,6 +291,28 @@ class MessageQueueFactory:
         """
         cls._registry[queue_type.lower()] = queue_class
 
+    @classmethod
+    def get_class(cls, queue_type: str) -> type[MessageQueueInterface]:
+        """
+        Get the registered implementation of a queue type.
+
+        Args:
+            queue_type: Queue type identifier
+
+        Returns:
+            Queue class
+
+        Raises:
+            ValueError: If queue type is not registered
+        """
+        try:
+            return cls._registry[queue_type.lower()]
+        except KeyError:
+            available = ", ".join(cls._registry.keys())
+            raise ValueError(
+                f"Unknown queue type: {queue_type}. Available types: {available}"
+            ) from None
+
     @classmethod
     def create(cls, queue_type: str, **kwargs) -> MessageQueueInterface:
         """
@@ -260,11 +328,7 @@ class MessageQueueFactory:
         Raises:
             ValueError: If queue type is not registered
         """
-        queue_class = cls._registry.get(queue_type.lower())
-        if not queue_class:
-            available = ", ".join(cls._registry.keys())
-            raise ValueError(f"Unknown queue type: {queue_type}. Available types: {available}")
-        return queue_class(**kwargs)
+        return cls.get_class(queue_type)(**kwargs)
 
     @classmethod
     def list_types(cls) -> list[str]:
@@ -1,7 +1,6 @@
 """Redis Streams implementation of message queue."""
 
 import asyncio
-import json
 from collections.abc import Callable
 from typing import Any
 
@@ -11,6 +10,7 @@ import structlog
 from openhqm.config import settings
 from openhqm.exceptions import QueueError
 from openhqm.queue.interface import MessageQueueInterface
+from openhqm.utils import serialization
 
 logger = structlog.get_logger(__name__)
 
@@ -80,7 +80,7 @@ class RedisQueue(MessageQueueInterface):
             )
 
             # Serialize message
-            message_data = {"payload": json.dumps(message)}
+            message_data = {"payload": serialization.dumps(message)}
 
             # Add to stream
             message_id = await self.redis.xadd(stream_name, message_data)
@@ -102,6 +102,42 @@ class RedisQueue(MessageQueueInterface):
             )
             return False
 
+    async def publish_batch(
+        self,
+        queue_name: str,
+        messages: list[dict[str, Any]],
+    ) -> list[bool]:
+        """
+        Publish several messages to a Redis stream in one round-trip.
+
+        Args:
+            queue_name: Stream name
+            messages: Message payloads
+
+        Returns:
+            One entry per message, True if it was published successfully
+        """
+        if not self.redis:
+            raise QueueError("Not connected to Redis")
+
+        stream_name = settings.queue.request_queue_name if queue_name == "requests" else queue_name
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for message in messages:
+                    pipe.xadd(stream_name, {"payload": serialization.dumps(message)})
+                message_ids = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.error(
+                "Failed to publish batch",
+                stream=queue_name,
+                size=len(messages),
+                error=str(e),
+            )
+            return [False] * len(messages)
+
+        logger.debug("Published batch to Redis", stream=stream_name, size=len(messages))
+        return [not isinstance(message_id, Exception) for message_id in message_ids]
+
     async def consume(
         self,
         queue_name: str,
@@ -162,7 +198,7 @@ class RedisQueue(MessageQueueInterface):
                     for message_id, message_data in stream_messages:
                         try:
                             # Deserialize message
-                            payload = json.loads(message_data["payload"])
+                            payload = serialization.loads(message_data["payload"])
 
                             # Process message
                             await handler(payload)
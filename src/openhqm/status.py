@@ -0,0 +1,19 @@
+"""Request status values shared by the API, cache and worker."""
+
+from enum import StrEnum
+
+
+class RequestStatus(StrEnum):
+    """Request processing status."""
+
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    TIMEOUT = "TIMEOUT"
+
+
+# Statuses after which a request will not change any more
+TERMINAL_STATUSES = frozenset(
+    {RequestStatus.COMPLETED.value, RequestStatus.FAILED.value, RequestStatus.TIMEOUT.value}
+)
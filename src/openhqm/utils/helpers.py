@@ -1,5 +1,6 @@
 """Common helper functions for OpenHQM."""
 
+from collections.abc import Sequence
 from typing import Any
 
 
@@ -18,7 +19,21 @@ def get_nested_value(data: dict[str, Any], path: str) -> Any:
         >>> get_nested_value(data, "metadata.user.id")
         123
     """
-    keys = path.split(".")
+    return get_path_value(data, path.split("."))
+
+
+def get_path_value(data: dict[str, Any], keys: Sequence[str]) -> Any:
+    """Get nested value from dictionary using a pre-split path.
+
+    Lets callers that look up the same path repeatedly split it once.
+
+    Args:
+        data: Dictionary to extract value from
+        keys: Path segments (e.g., ("metadata", "user", "id"))
+
+    Returns:
+        Value at path, or None if not found
+    """
     value: Any = data
     for key in keys:
         if isinstance(value, dict):
@@ -20,8 +20,10 @@ def setup_logging() -> None:
         level=log_level,
     )
 
-    # Structlog processors
+    # Structlog processors; records below the configured level are dropped
+    # first so they never pay for timestamping and rendering
     processors = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
@@ -0,0 +1,39 @@
+"""JSON serialization helpers, backed by orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Compact JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
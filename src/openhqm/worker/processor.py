@@ -210,8 +210,7 @@ class MessageProcessor:
 
         # Check partitioning - skip if not assigned to this worker
         if self._partition_manager and full_message:
-            should_process = self._partition_manager.should_process_message(full_message)
-            if not should_process:
+            if not self._partition_manager.claim_message(full_message):
                 logger.debug("Message skipped - not assigned to this partition")
                 # Return empty response to acknowledge message without processing
                 return {"skipped": True, "reason": "partition_not_assigned"}, 200, {}
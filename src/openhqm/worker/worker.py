@@ -112,28 +112,25 @@ class Worker:
 
             processing_time = (time.time() - start_time) * 1000  # ms
 
-            # Update status to COMPLETED
-            await self.cache.set(
-                f"req:{correlation_id}:meta",
+            # Mark COMPLETED and store the response in one write, then wake waiters
+            completed_at = datetime.now(UTC).isoformat()
+            await self.cache.set_many(
                 {
-                    "status": "COMPLETED",
-                    "submitted_at": message.get("timestamp"),
-                    "updated_at": datetime.now(UTC).isoformat(),
-                },
-                ttl=3600,
-            )
-
-            # Store response
-            await self.cache.set(
-                f"resp:{correlation_id}",
-                {
-                    "result": result,
-                    "status_code": status_code,
-                    "headers": response_headers,
-                    "processing_time_ms": int(processing_time),
-                    "completed_at": datetime.now(UTC).isoformat(),
+                    f"req:{correlation_id}:meta": {
+                        "status": "COMPLETED",
+                        "submitted_at": message.get("timestamp"),
+                        "updated_at": completed_at,
+                    },
+                    f"resp:{correlation_id}": {
+                        "result": result,
+                        "status_code": status_code,
+                        "headers": response_headers,
+                        "processing_time_ms": int(processing_time),
+                        "completed_at": completed_at,
+                    },
                 },
                 ttl=3600,
+                notify=True,
             )
 
             # Publish response to response queue
@@ -231,22 +228,20 @@ class Worker:
             error: Error description
         """
         try:
-            await self.cache.set(
-                f"req:{correlation_id}:meta",
-                {
-                    "status": "FAILED",
-                    "updated_at": datetime.now(UTC).isoformat(),
-                },
-                ttl=3600,
-            )
-
-            await self.cache.set(
-                f"resp:{correlation_id}",
+            failed_at = datetime.now(UTC).isoformat()
+            await self.cache.set_many(
                 {
-                    "error": error,
-                    "completed_at": datetime.now(UTC).isoformat(),
+                    f"req:{correlation_id}:meta": {
+                        "status": "FAILED",
+                        "updated_at": failed_at,
+                    },
+                    f"resp:{correlation_id}": {
+                        "error": error,
+                        "completed_at": failed_at,
+                    },
                 },
                 ttl=3600,
+                notify=True,
             )
 
         except Exception as e:
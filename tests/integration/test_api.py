@@ -1,11 +1,18 @@
 """Comprehensive API integration tests."""
 
+import asyncio
+import functools
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from openhqm.api.app import create_app
+from openhqm.api.models import RequestStatus, SubmitRequest
+from openhqm.api.routes import _enqueue_request, router
+from openhqm.cache.interface import CacheInterface
+from openhqm.config import settings
+from openhqm.queue.batcher import PublishBatcher
 
 
 @pytest.fixture
@@ -24,6 +31,18 @@ def mock_cache():
     cache.get = AsyncMock()
     cache.set = AsyncMock()
     cache.connect = AsyncMock()
+
+    async def mget(keys):
+        return [await cache.get(key) for key in keys]
+
+    cache.mget = AsyncMock(side_effect=mget)
+
+    async def set_many(items, ttl=None, notify=False):
+        return await CacheInterface.set_many(cache, items, ttl, notify)
+
+    cache.set_many = AsyncMock(side_effect=set_many)
+    # No notifications: waiting falls back to polling, as with a plain cache
+    cache.watch = functools.partial(CacheInterface.watch, cache)
     return cache
 
 
@@ -48,6 +67,14 @@ def test_health_check(client):
     assert response.json()["status"] == "healthy"
 
 
+def test_health_check_is_cached(client):
+    """Test health check results are reused within the cache TTL."""
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+
+    assert second["timestamp"] == first["timestamp"]
+
+
 def test_metrics_endpoint(client):
     """Test metrics endpoint returns Prometheus format."""
     response = client.get("/metrics")
@@ -58,6 +85,26 @@ def test_metrics_endpoint(client):
     assert b"openhqm_" in response.content
 
 
+def test_metrics_label_requests_by_route_template(client, mock_cache):
+    """Test request metrics use the route template, not the raw path."""
+    mock_cache.get.return_value = None
+    client.get("/api/v1/status/metrics-label-test")
+    client.get("/no/such/path")
+
+    content = client.get("/metrics").text
+
+    assert 'endpoint="/api/v1/status/{correlation_id}"' in content
+    assert 'endpoint="unmatched"' in content
+    assert "metrics-label-test" not in content
+    assert "/no/such/path" not in content
+
+
+def test_api_routes_declare_response_model():
+    """Test every API route declares a response model for direct JSON serialization."""
+    for route in router.routes:
+        assert route.response_model is not None, route.path
+
+
 def test_submit_request_success(client, mock_queue):
     """Test successful request submission."""
     payload = {
@@ -146,6 +193,94 @@ def test_submit_request_queue_failure(client, mock_queue):
     assert "detail" in response.json()
 
 
+def test_submit_request_cache_failure(client, mock_queue, mock_cache):
+    """Test a failure to record the request is a 503 and nothing is queued."""
+    mock_cache.set.side_effect = Exception("Cache error")
+
+    response = client.post("/api/v1/submit", json={"payload": {"data": "test"}})
+
+    assert response.status_code == 503
+    mock_queue.publish.assert_not_called()
+
+
+async def test_submit_request_async_publish_failure_marks_failed(mock_queue, mock_cache):
+    """Test an unconfirmed publish is accepted, then marked FAILED if it fails."""
+    mock_queue.publish_async = lambda queue_name, message: asyncio.ensure_future(
+        asyncio.sleep(0, result=False)
+    )
+    publisher = PublishBatcher(mock_queue, "requests")
+
+    with patch.object(settings.queue, "publish_async", True):
+        submitted = await _enqueue_request(SubmitRequest(payload={"x": 1}), publisher, mock_cache)
+    await publisher.close()
+
+    assert submitted.status == RequestStatus.PENDING
+    mock_queue.publish.assert_not_called()
+    meta_key, meta = mock_cache.set.call_args_list[1].args[:2]
+    assert meta_key == f"req:{submitted.correlation_id}:meta"
+    assert meta["status"] == "FAILED"
+    resp_key, resp = mock_cache.set.call_args_list[2].args[:2]
+    assert resp_key == f"resp:{submitted.correlation_id}"
+    assert "error" in resp
+
+
+def test_submit_request_wait_returns_result(client, mock_cache):
+    """Test that submit with wait returns the result inline once completed."""
+    mock_cache.get.side_effect = [
+        {"status": "COMPLETED", "submitted_at": "2026-02-08T10:00:00Z"},
+        {"result": {"output": "done"}, "status_code": 200, "completed_at": "2026-02-08T10:00:01Z"},
+    ]
+
+    response = client.post("/api/v1/submit", params={"wait": 5}, json={"payload": {"x": 1}})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "COMPLETED"
+    assert data["result"] == {"output": "done"}
+
+
+def test_submit_request_wait_times_out(client, mock_cache):
+    """Test that submit with wait falls back to 202 when the result is late."""
+    mock_cache.get.return_value = {"status": "PENDING", "submitted_at": "2026-02-08T10:00:00Z"}
+
+    response = client.post("/api/v1/submit", params={"wait": 0.1}, json={"payload": {"x": 1}})
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "PENDING"
+    assert "submitted_at" in data
+
+
+def test_submit_batch(client, mock_queue):
+    """Test submitting several requests in one call."""
+    payload = {"items": [{"payload": {"batch_id": i}} for i in range(3)]}
+
+    response = client.post("/api/v1/submit-batch", json=payload)
+
+    assert response.status_code == 202
+    items = response.json()["items"]
+    assert len(items) == 3
+    assert len({item["correlation_id"] for item in items}) == 3
+    assert all(item["status"] == "PENDING" for item in items)
+    assert mock_queue.publish.call_count == 3
+
+
+def test_submit_batch_empty(client):
+    """Test that an empty batch is rejected."""
+    response = client.post("/api/v1/submit-batch", json={"items": []})
+
+    assert response.status_code == 422
+
+
+def test_submit_batch_queue_failure(client, mock_queue):
+    """Test that a publish failure fails the batch."""
+    mock_queue.publish.return_value = False
+
+    response = client.post("/api/v1/submit-batch", json={"items": [{"payload": {}}]})
+
+    assert response.status_code == 503
+
+
 def test_get_status_pending(client, mock_cache):
     """Test getting status for pending request."""
     mock_cache.get.return_value = {
@@ -220,6 +355,20 @@ def test_get_response_completed(client, mock_cache):
     assert data["processing_time_ms"] == 1500
 
 
+def test_get_response_large_result_is_gzipped(client, mock_cache):
+    """Test that large results are compressed for clients accepting gzip."""
+    mock_cache.get.side_effect = [
+        {"status": "COMPLETED", "submitted_at": "2026-02-08T10:00:00Z"},
+        {"result": {"output": "x" * 4096}, "completed_at": "2026-02-08T10:00:10Z"},
+    ]
+
+    response = client.get("/api/v1/response/test-large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["result"]["output"] == "x" * 4096
+
+
 def test_get_response_still_processing(client, mock_cache):
     """Test getting response when request is still processing."""
     mock_cache.get.side_effect = [
@@ -264,6 +413,72 @@ def test_get_response_failed(client, mock_cache):
     assert "Network timeout" in data["error"]
 
 
+def test_get_response_long_poll_waits_for_completion(client, mock_cache):
+    """Test that wait holds the request until it reaches a final status."""
+    mock_cache.get.side_effect = [
+        {"status": "PROCESSING", "submitted_at": "2026-02-08T10:00:00Z"},
+        {"status": "PROCESSING", "submitted_at": "2026-02-08T10:00:00Z"},
+        {"status": "COMPLETED", "submitted_at": "2026-02-08T10:00:00Z"},
+        {"result": {"output": "done"}, "status_code": 200, "completed_at": "2026-02-08T10:00:01Z"},
+    ]
+
+    response = client.get("/api/v1/response/test-long-poll", params={"wait": 5})
+
+    assert response.status_code == 200
+    assert response.json()["result"] == {"output": "done"}
+    assert mock_cache.get.call_count == 4
+
+
+def test_get_response_long_poll_times_out(client, mock_cache):
+    """Test that wait returns the current status once the deadline passes."""
+    mock_cache.get.side_effect = lambda key: (
+        {"status": "PROCESSING", "submitted_at": "2026-02-08T10:00:00Z"}
+        if key.endswith(":meta")
+        else None
+    )
+
+    response = client.get("/api/v1/response/test-long-poll", params={"wait": 0.1})
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "PROCESSING"
+
+
+def test_get_response_wait_out_of_range(client):
+    """Test that excessive wait values are rejected."""
+    response = client.get("/api/v1/response/test-long-poll", params={"wait": 600})
+
+    assert response.status_code == 422
+
+
+def test_get_responses_batch(client, mock_cache):
+    """Test retrieving several results in one call."""
+    entries = {
+        "req:done:meta": {"status": "COMPLETED", "submitted_at": "2026-02-08T10:00:00Z"},
+        "resp:done": {"result": {"output": "ok"}, "completed_at": "2026-02-08T10:00:01Z"},
+        "req:busy:meta": {"status": "PROCESSING", "submitted_at": "2026-02-08T10:00:00Z"},
+    }
+    mock_cache.get.side_effect = entries.get
+
+    response = client.get("/api/v1/responses", params={"ids": "done,busy,missing"})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["correlation_id"] for item in items] == ["done", "busy"]
+    assert items[0]["result"] == {"output": "ok"}
+    assert items[1]["status"] == "PROCESSING"
+    # All entries are fetched in a single cache round-trip
+    mock_cache.mget.assert_awaited_once()
+
+
+def test_get_responses_too_many_ids(client):
+    """Test that oversized ID lists are rejected."""
+    ids = ",".join(f"id-{i}" for i in range(101))
+
+    response = client.get("/api/v1/responses", params={"ids": ids})
+
+    assert response.status_code == 400
+
+
 def test_get_response_not_found(client, mock_cache):
     """Test getting response for non-existent request."""
     mock_cache.get.return_value = None
@@ -271,6 +486,8 @@ def test_get_response_not_found(client, mock_cache):
     response = client.get("/api/v1/response/nonexistent")
 
     assert response.status_code == 404
+    assert response.json() == {"detail": "Request not found or expired"}
+    assert response.headers["content-type"] == "application/json"
 
 
 def test_cors_headers(client):
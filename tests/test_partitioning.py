@@ -1,6 +1,9 @@
 """Tests for partition manager."""
 
-from openhqm.partitioning.manager import PartitionManager
+import hashlib
+from collections import Counter
+
+from openhqm.partitioning.manager import PartitionManager, _jump_hash
 from openhqm.partitioning.models import PartitionConfig, PartitionStrategy
 
 
@@ -138,3 +141,146 @@ def test_multiple_workers():
         all_partitions.update(worker._worker_partitions)
 
     assert all_partitions == set(range(10))
+
+
+def test_hash_distributes_keys_evenly():
+    """Test the default hash spreads keys across all partitions."""
+    config = PartitionConfig(enabled=True, partition_count=10)
+    manager = PartitionManager(config, "worker-0")
+
+    counts = Counter(manager.get_partition_for_key(f"session-{i}") for i in range(10_000))
+
+    assert set(counts) == set(range(10))
+    assert min(counts.values()) > 800
+
+
+def test_secure_hash_uses_sha256():
+    """Test secure_hash partitions keys by their SHA-256 digest."""
+    config = PartitionConfig(enabled=True, partition_count=10, secure_hash=True)
+    manager = PartitionManager(config, "worker-0")
+
+    expected = _jump_hash(int(hashlib.sha256(b"test-key").hexdigest(), 16), 10)
+    assert manager.get_partition_for_key("test-key") == expected
+
+
+def test_adding_a_partition_moves_few_keys():
+    """Test growing partition_count only remaps about 1/n of the keys."""
+    keys = [f"session-{i}" for i in range(10_000)]
+    before = PartitionManager(PartitionConfig(enabled=True, partition_count=10), "worker-0")
+    after = PartitionManager(PartitionConfig(enabled=True, partition_count=11), "worker-0")
+
+    moved = [
+        key for key in keys if before.get_partition_for_key(key) != after.get_partition_for_key(key)
+    ]
+
+    # Ideal is 1/11 (~9%); modulo hashing would move ~91%
+    assert len(moved) < len(keys) * 0.12
+    assert all(after.get_partition_for_key(key) == 10 for key in moved)
+
+
+def test_partition_decisions_are_memoized(monkeypatch):
+    """Test a repeated key is hashed only once."""
+    manager = PartitionManager(PartitionConfig(enabled=True, partition_count=10), "worker-0")
+    calls = []
+    original = manager._hash_key
+    monkeypatch.setattr(manager, "_hash_key", lambda key: calls.append(key) or original(key))
+
+    first = manager.get_partition_for_key("session-1")
+    assert manager.get_partition_for_key("session-1") == first
+    assert calls == ["session-1"]
+
+
+def test_claim_message_tracks_owned_sessions():
+    """Test claiming a message checks ownership and tracks its session in one pass."""
+    config = PartitionConfig(enabled=True, partition_count=10)
+    manager = PartitionManager(config, "worker-0")
+    message = {"correlation_id": "test-123", "metadata": {"session_id": "sess-abc"}}
+    partition_id, session_id, _ = manager.classify(message)
+
+    manager.set_assigned_partitions({partition_id})
+    assert manager.claim_message(message) is True
+    assert manager.claim_message(message) is True
+    assert session_id == "sess-abc"
+    assert manager.get_session_stats()["total_messages"] == 2
+
+    manager.set_assigned_partitions(set())
+    assert manager.claim_message(message) is False
+    assert manager.get_session_stats()["total_messages"] == 2
+
+
+def test_cleanup_expired_sessions(monkeypatch):
+    """Test sessions idle longer than the TTL are dropped."""
+    config = PartitionConfig(enabled=True, partition_count=10, sticky_session_ttl=60)
+    manager = PartitionManager(config, "worker-0")
+    now = 1000.0
+    monkeypatch.setattr("openhqm.partitioning.manager.time.monotonic", lambda: now)
+
+    manager._record_session("old", 1)
+    now += 50
+    manager._record_session("new", 2)
+    manager._record_session("new", 2)
+    now += 20
+    manager.cleanup_expired_sessions()
+
+    assert manager.get_session("old") is None
+    session = manager.get_session("new")
+    assert session.partition_id == 2
+    assert session.message_count == 2
+    assert session.last_seen == 1050.0
+    assert manager.get_session_stats()["active_sessions"] == 1
+    assert manager.get_session_stats()["total_messages"] == 2
+
+
+def test_classify_reads_keys_under_a_shared_prefix():
+    """Test keys are found whether or not their paths share a prefix."""
+    shared = PartitionManager(
+        PartitionConfig(
+            enabled=True,
+            partition_key_field="metadata.route.key",
+            session_key_field="metadata.session_id",
+        ),
+        "worker-0",
+    )
+    disjoint = PartitionManager(
+        PartitionConfig(enabled=True, partition_key_field="tenant", session_key_field="sid"),
+        "worker-0",
+    )
+
+    message = {"metadata": {"route": {"key": "k1"}, "session_id": "s1"}}
+    assert shared.classify(message)[1] == "s1"
+    assert shared.classify(message)[0] == shared.get_partition_for_key("k1")
+    assert shared.classify({"metadata": "not-a-dict"})[:2] == (None, None)
+
+    assert disjoint.classify({"tenant": "t1", "sid": "s2"})[:2] == (
+        disjoint.get_partition_for_key("t1"),
+        "s2",
+    )
+
+
+def test_round_robin_strategy_ignores_key(monkeypatch):
+    """Test round-robin assignment follows the clock rather than the key."""
+    config = PartitionConfig(enabled=True, partition_count=10, strategy="round_robin")
+    manager = PartitionManager(config, "worker-0")
+    monkeypatch.setattr("openhqm.partitioning.manager.time.monotonic_ns", lambda: 7_000_000)
+
+    assert manager.get_partition_for_key("a") == 7
+    assert manager.get_partition_for_key("b") == 7
+
+
+def test_cleanup_expires_sessions_by_latest_activity(monkeypatch):
+    """Test a session seen again is kept even if it started before expired ones."""
+    config = PartitionConfig(enabled=True, partition_count=10, sticky_session_ttl=60)
+    manager = PartitionManager(config, "worker-0")
+    now = 1000.0
+    monkeypatch.setattr("openhqm.partitioning.manager.time.monotonic", lambda: now)
+
+    manager._record_session("first", 1)
+    manager._record_session("second", 2)
+    now += 30
+    manager._record_session("first", 1)
+    now += 40
+    manager.cleanup_expired_sessions()
+
+    assert manager.get_session("second") is None
+    assert manager.get_session("first").message_count == 2
+    assert manager.get_session_stats()["total_messages"] == 2
@@ -0,0 +1,84 @@
+"""Unit tests for the Azure Event Hubs queue."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openhqm.queue.azure_eventhubs import AzureEventHubsQueue
+
+
+class FakeEventBatch:
+    """EventDataBatch stand-in that holds events up to a byte budget."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.events: list[bytes] = []
+
+    def add(self, event: bytes) -> None:
+        if sum(map(len, self.events)) + len(event) > self.max_size:
+            raise ValueError("EventDataBatch has reached its size limit")
+        self.events.append(event)
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    """Create an Event Hubs queue with a mocked producer client."""
+    monkeypatch.setattr("openhqm.queue.azure_eventhubs._event_data", lambda body: body)
+    queue = AzureEventHubsQueue(connection_string="Endpoint=sb://test/", eventhub_name="hub")
+    queue.producer_client = MagicMock()
+    queue.producer_client.create_batch = AsyncMock(side_effect=lambda: FakeEventBatch(40))
+    queue.producer_client.send_batch = AsyncMock()
+    return queue
+
+
+def sent_batches(queue):
+    """Get the events of every batch sent, in order."""
+    return [call.args[0].events for call in queue.producer_client.send_batch.await_args_list]
+
+
+async def test_publish_batch_rolls_over_full_batches(queue):
+    """Test a full batch is sent and the remaining messages go in a new one."""
+    messages = [{"id": i} for i in range(5)]  # 8 bytes each, 5 fit per batch
+
+    results = await queue.publish_batch("requests", messages + [{"id": 5}])
+
+    assert results == [True] * 6
+    assert [len(events) for events in sent_batches(queue)] == [5, 1]
+
+
+async def test_publish_batch_skips_oversized_messages(queue):
+    """Test a message that cannot fit any batch fails alone."""
+    messages = [{"id": 0}, {"data": "x" * 50}, {"id": 2}]
+
+    assert await queue.publish_batch("requests", messages) == [True, False, True]
+    # The oversized message first looks like a full batch, so the pending one is sent
+    assert [len(events) for events in sent_batches(queue)] == [1, 1]
+
+
+async def test_publish_batch_skips_oversized_message_after_rollover(queue):
+    """Test an oversized message found while a batch is full does not stop the rest."""
+    messages = [{"id": i} for i in range(5)] + [{"data": "x" * 50}, {"id": 6}]
+
+    results = await queue.publish_batch("requests", messages)
+
+    assert results == [True] * 5 + [False, True]
+    assert [len(events) for events in sent_batches(queue)] == [5, 1]
+
+
+async def test_publish_batch_continues_after_a_failed_send(queue):
+    """Test a failed send only fails its own batch."""
+    queue.producer_client.send_batch.side_effect = [RuntimeError("link detached"), None]
+    messages = [{"id": i} for i in range(7)]
+
+    results = await queue.publish_batch("requests", messages)
+
+    assert results == [False] * 5 + [True, True]
+    assert queue.producer_client.send_batch.await_count == 2
+
+
+async def test_publish_batch_skips_unserializable_messages(queue):
+    """Test a message that cannot be encoded fails alone."""
+    messages = [{"id": 0}, {"id": object()}, {"id": 2}]
+
+    assert await queue.publish_batch("requests", messages) == [True, False, True]
+    assert [len(events) for events in sent_batches(queue)] == [2]
@@ -0,0 +1,109 @@
+"""Unit tests for the queue publish batcher."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openhqm.queue.batcher import PublishBatcher
+from openhqm.queue.interface import MessageQueueInterface
+
+
+@pytest.fixture
+def queue():
+    """Create a mock queue backend."""
+    queue = AsyncMock()
+    queue.publish = AsyncMock(return_value=True)
+
+    async def publish_batch(queue_name, messages):
+        return [True] * len(messages)
+
+    queue.publish_batch = AsyncMock(side_effect=publish_batch)
+    return queue
+
+
+async def test_batch_size_one_publishes_directly(queue):
+    """Test batching is bypassed when the batch size is one."""
+    batcher = PublishBatcher(queue, "requests")
+
+    assert await batcher.publish({"id": 1}) is True
+
+    queue.publish.assert_awaited_once_with("requests", {"id": 1})
+    queue.publish_batch.assert_not_called()
+
+
+async def test_concurrent_publishes_share_a_batch(queue):
+    """Test concurrent callers are sent in a single backend call."""
+    batcher = PublishBatcher(queue, "requests", max_batch_size=10)
+
+    results = await asyncio.gather(*(batcher.publish({"id": i}) for i in range(5)))
+    await batcher.close()
+
+    assert results == [True] * 5
+    queue.publish_batch.assert_awaited_once_with("requests", [{"id": i} for i in range(5)])
+
+
+async def test_batches_respect_max_size(queue):
+    """Test a burst larger than the batch size is split across calls."""
+    batcher = PublishBatcher(queue, "requests", max_batch_size=2)
+
+    await asyncio.gather(*(batcher.publish({"id": i}) for i in range(5)))
+    await batcher.close()
+
+    sizes = [len(call.args[1]) for call in queue.publish_batch.await_args_list]
+    assert sum(sizes) == 5
+    assert max(sizes) <= 2
+
+
+async def test_batch_failure_propagates_to_callers(queue):
+    """Test a backend error is raised to every caller in the batch."""
+    queue.publish_batch.side_effect = RuntimeError("broker down")
+    batcher = PublishBatcher(queue, "requests", max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.publish({"id": 1}), batcher.publish({"id": 2}), return_exceptions=True
+    )
+    await batcher.close()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_default_publish_batch_uses_publish():
+    """Test the interface default publishes each message and reports failures."""
+    queue = AsyncMock(spec=MessageQueueInterface)
+    queue.publish = AsyncMock(side_effect=[True, False, RuntimeError("boom")])
+
+    results = await MessageQueueInterface.publish_batch(queue, "requests", [{}, {}, {}])
+
+    assert results == [True, False, False]
+
+
+async def test_publish_nowait_reports_outcome_on_close(queue):
+    """Test unconfirmed publishes are reaped and reported before close returns."""
+    outcomes = []
+
+    async def on_confirm(success):
+        outcomes.append(success)
+
+    batcher = PublishBatcher(queue, "requests", max_batch_size=10)
+    batcher.publish_nowait({"id": 1}, on_confirm)
+    batcher.publish_nowait({"id": 2}, on_confirm)
+    await batcher.close()
+
+    assert outcomes == [True, True]
+    queue.publish_batch.assert_awaited_once()
+
+
+async def test_publish_nowait_treats_errors_as_failure(queue):
+    """Test a backend error is reported as a failed publish."""
+    queue.publish_batch.side_effect = RuntimeError("broker down")
+    outcomes = []
+
+    async def on_confirm(success):
+        outcomes.append(success)
+
+    batcher = PublishBatcher(queue, "requests", max_batch_size=10)
+    batcher.publish_nowait({"id": 1}, on_confirm)
+    await batcher.close()
+
+    assert outcomes == [False]
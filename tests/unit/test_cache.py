@@ -0,0 +1,110 @@
+"""Unit tests for the Redis cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openhqm.cache.redis_cache import RedisCache
+
+
+@pytest.fixture
+def cache():
+    """Create a Redis cache with a mocked client."""
+    cache = RedisCache(url="redis://localhost:6379", default_ttl=60)
+    cache.redis = AsyncMock()
+    return cache
+
+
+async def test_set_stores_json_bytes(cache):
+    """Test values are stored as JSON bytes with the default TTL."""
+    assert await cache.set("key", {"status": "PENDING"}) is True
+
+    cache.redis.set.assert_awaited_once_with("key", b'{"status":"PENDING"}', ex=60)
+
+
+async def test_get_decodes_json_bytes(cache):
+    """Test stored JSON bytes are decoded back to a dict."""
+    cache.redis.get.return_value = b'{"status":"COMPLETED"}'
+
+    assert await cache.get("key") == {"status": "COMPLETED"}
+
+
+async def test_get_missing_key(cache):
+    """Test a missing key returns None."""
+    cache.redis.get.return_value = None
+
+    assert await cache.get("key") is None
+
+
+async def test_mget_decodes_each_value(cache):
+    """Test several keys are fetched in one call, with None for missing keys."""
+    cache.redis.mget.return_value = [b'{"status":"COMPLETED"}', None]
+
+    assert await cache.mget(["meta", "resp"]) == [{"status": "COMPLETED"}, None]
+    cache.redis.mget.assert_awaited_once_with(["meta", "resp"])
+
+
+async def test_notify_publishes_on_key_channel(cache):
+    """Test notifications are published on the key's change channel."""
+    await cache.notify("resp:abc")
+
+    cache.redis.publish.assert_awaited_once_with("openhqm:changed:resp:abc", b"")
+
+
+async def test_watch_wakes_on_notification(cache):
+    """Test a watcher wakes when its key's notification arrives."""
+    notified = asyncio.Event()
+
+    class FakePubSub:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def psubscribe(self, pattern):
+            pass
+
+        async def listen(self):
+            await notified.wait()
+            yield {"type": "pmessage", "channel": b"openhqm:changed:resp:other"}
+            yield {"type": "pmessage", "channel": b"openhqm:changed:resp:abc"}
+            await asyncio.Event().wait()
+
+    cache.redis.pubsub = MagicMock(return_value=FakePubSub())
+
+    async with cache.watch("resp:abc") as wait:
+        assert await wait(0.01) is False
+        notified.set()
+        assert await wait(1) is True
+
+    await cache.close()
+
+
+async def test_set_many_writes_and_notifies_in_one_transaction(cache):
+    """Test several keys and their notifications go out in one MULTI/EXEC."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True, 0, 0])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    cache.redis.pipeline = MagicMock(return_value=pipe)
+
+    items = {"req:abc:meta": {"status": "COMPLETED"}, "resp:abc": {"result": 1}}
+    assert await cache.set_many(items, notify=True) is True
+
+    cache.redis.pipeline.assert_called_once_with(transaction=True)
+    pipe.set.assert_any_call("req:abc:meta", b'{"status":"COMPLETED"}', ex=60)
+    pipe.set.assert_any_call("resp:abc", b'{"result":1}', ex=60)
+    pipe.publish.assert_any_call("openhqm:changed:resp:abc", b"")
+    pipe.execute.assert_awaited_once()
+
+
+async def test_connect_is_idempotent(cache):
+    """Test connecting an already connected cache keeps the existing client."""
+    client = cache.redis
+
+    await cache.connect()
+
+    assert cache.redis is client
+    client.ping.assert_not_called()
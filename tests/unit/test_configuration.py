@@ -221,6 +221,7 @@ class TestServerSettings:
         assert settings.host == "0.0.0.0"
         assert settings.port == 8000
         assert settings.reload is False
+        assert settings.gzip_min_size == 1024
 
     def test_server_settings_custom(self):
         """Test custom server configuration."""
@@ -0,0 +1,56 @@
+"""Unit tests for the GCP Pub/Sub queue."""
+
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from openhqm.queue.gcp_pubsub import GCPPubSubQueue
+from openhqm.utils import serialization
+
+
+def resolved(result=None, error=None) -> Future:
+    """Create a publish future that has already completed."""
+    future: Future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+@pytest.fixture
+def queue():
+    """Create a Pub/Sub queue with a mocked publisher client."""
+    queue = GCPPubSubQueue(project_id="proj")
+    queue.publisher = MagicMock()
+    return queue
+
+
+async def test_publish_batch_submits_every_message(queue):
+    """Test all messages are handed to the client with one shared timestamp."""
+    queue.publisher.publish.side_effect = lambda *args, **kwargs: resolved("id")
+
+    results = await queue.publish_batch("requests", [{"id": 1}, {"id": 2}])
+
+    assert results == [True, True]
+    calls = queue.publisher.publish.call_args_list
+    assert [call.args for call in calls] == [
+        ("projects/proj/topics/requests", serialization.dumps({"id": 1})),
+        ("projects/proj/topics/requests", serialization.dumps({"id": 2})),
+    ]
+    assert calls[0].kwargs["timestamp"] == calls[1].kwargs["timestamp"]
+
+
+async def test_publish_batch_reports_failures_per_message(queue):
+    """Test a rejected submit or failed publish only fails its own message."""
+    queue.publisher.publish.side_effect = [
+        resolved("id-1"),
+        RuntimeError("client closed"),
+        resolved(error=RuntimeError("deadline exceeded")),
+        resolved("id-4"),
+    ]
+
+    results = await queue.publish_batch("requests", [{"id": i} for i in range(4)])
+
+    assert results == [True, False, False, True]
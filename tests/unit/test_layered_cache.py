@@ -0,0 +1,78 @@
+"""Unit tests for the process-local layered cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openhqm.cache.interface import CacheInterface
+from openhqm.cache.layered import LayeredCache
+
+
+@pytest.fixture
+def backend():
+    """Create a mock shared cache."""
+    backend = AsyncMock(spec=CacheInterface)
+    backend.get.return_value = {"status": "PENDING"}
+    return backend
+
+
+async def test_repeated_get_is_served_locally(backend):
+    """Test a second read within the TTL does not reach the backend."""
+    cache = LayeredCache(backend, ttl=60)
+
+    assert await cache.get("req:1:meta") == {"status": "PENDING"}
+    assert await cache.get("req:1:meta") == {"status": "PENDING"}
+
+    backend.get.assert_awaited_once_with("req:1:meta")
+
+
+async def test_expired_entry_is_refetched(backend, monkeypatch):
+    """Test an entry older than the TTL is read from the backend again."""
+    now = 1000.0
+    monkeypatch.setattr("openhqm.cache.layered.time.monotonic", lambda: now)
+    cache = LayeredCache(backend, ttl=0.2, final_ttl=10)
+
+    await cache.get("req:1:meta")
+    now += 0.5
+    backend.get.return_value = {"status": "COMPLETED"}
+    assert await cache.get("req:1:meta") == {"status": "COMPLETED"}
+
+    # Final statuses are kept for final_ttl
+    now += 5
+    assert await cache.get("req:1:meta") == {"status": "COMPLETED"}
+    assert backend.get.await_count == 2
+
+
+async def test_set_drops_local_copy(backend):
+    """Test writes through the layered cache invalidate the local entry."""
+    cache = LayeredCache(backend, ttl=60)
+
+    await cache.get("req:1:meta")
+    await cache.set("req:1:meta", {"status": "PROCESSING"})
+    await cache.get("req:1:meta")
+
+    assert backend.get.await_count == 2
+    backend.set.assert_awaited_once_with("req:1:meta", {"status": "PROCESSING"}, None)
+
+
+async def test_mget_reads_through_and_refreshes(backend):
+    """Test mget always reads the backend and refreshes local entries."""
+    backend.mget.return_value = [{"status": "COMPLETED"}, {"result": 1}]
+    cache = LayeredCache(backend, ttl=60)
+
+    await cache.get("req:1:meta")
+    assert await cache.mget(["req:1:meta", "resp:1"]) == [{"status": "COMPLETED"}, {"result": 1}]
+    assert await cache.get("req:1:meta") == {"status": "COMPLETED"}
+
+    backend.get.assert_awaited_once()
+
+
+async def test_oldest_entry_is_evicted_when_full(backend):
+    """Test the local layer stays within max_entries."""
+    cache = LayeredCache(backend, ttl=60, max_entries=2)
+
+    for key in ("a", "b", "c"):
+        await cache.get(key)
+    await cache.get("a")
+
+    assert backend.get.await_count == 4
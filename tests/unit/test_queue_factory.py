@@ -0,0 +1,55 @@
+"""Unit tests for the queue factory."""
+
+import sys
+
+import pytest
+
+from openhqm.exceptions import QueueError
+from openhqm.queue.factory import _queue_config, register_queue
+from openhqm.queue.interface import MessageQueueFactory
+
+
+def test_register_queue_imports_only_the_requested_backend(monkeypatch):
+    """Test registering one backend leaves the other backend modules unimported."""
+    monkeypatch.setattr(MessageQueueFactory, "_registry", {})
+    monkeypatch.delitem(sys.modules, "openhqm.queue.gcp_pubsub", raising=False)
+
+    register_queue("mqtt")
+
+    assert MessageQueueFactory.list_types() == ["mqtt"]
+    assert "openhqm.queue.gcp_pubsub" not in sys.modules
+
+
+def test_register_queue_rejects_unknown_type():
+    """Test an unknown queue type raises QueueError."""
+    with pytest.raises(QueueError, match="nope"):
+        register_queue("nope")
+
+
+def test_register_queue_reports_missing_backend():
+    """Test a backend whose module is missing raises QueueError."""
+    with pytest.raises(QueueError, match="not available"):
+        register_queue("kafka")
+
+
+def test_backend_classes_are_imported_on_first_access(monkeypatch):
+    """Test backend classes are exposed lazily on the queue package."""
+    import openhqm.queue
+
+    monkeypatch.delitem(sys.modules, "openhqm.queue.mqtt", raising=False)
+    monkeypatch.delitem(vars(openhqm.queue), "MQTTQueue", raising=False)
+
+    mqtt_queue = openhqm.queue.MQTTQueue
+
+    assert mqtt_queue is sys.modules["openhqm.queue.mqtt"].MQTTQueue
+    with pytest.raises(AttributeError):
+        openhqm.queue.NotAQueue  # noqa: B018
+
+
+def test_queue_config_builds_only_the_selected_backend():
+    """Test constructor arguments are built for the requested queue type."""
+    config = _queue_config("mqtt")
+
+    assert set(config) == {"broker_host", "broker_port", "username", "password", "qos", "client_id"}
+    with pytest.raises(QueueError, match="No configuration"):
+        _queue_config("custom")
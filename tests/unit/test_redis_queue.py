@@ -0,0 +1,42 @@
+"""Unit tests for the Redis Streams queue."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openhqm.queue.redis_queue import RedisQueue
+from openhqm.utils import serialization
+
+
+@pytest.fixture
+def queue():
+    """Create a Redis queue with a mocked client."""
+    queue = RedisQueue(url="redis://localhost:6379")
+    queue.redis = AsyncMock()
+    return queue
+
+
+async def test_publish_serializes_once(queue):
+    """Test the message is encoded with the shared serializer."""
+    message = {"correlation_id": "abc", "payload": {"x": 1}}
+
+    assert await queue.publish("requests", message) is True
+
+    stream, fields = queue.redis.xadd.await_args.args
+    assert stream == "openhqm-requests"
+    assert fields == {"payload": serialization.dumps(message)}
+
+
+async def test_publish_batch_uses_one_pipeline(queue):
+    """Test a batch is sent as pipelined XADDs, reporting per-message failures."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["1-0", Exception("OOM")])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    queue.redis.pipeline = MagicMock(return_value=pipe)
+
+    results = await queue.publish_batch("requests", [{"id": 1}, {"id": 2}])
+
+    assert results == [True, False]
+    assert pipe.xadd.call_count == 2
+    queue.redis.pipeline.assert_called_once_with(transaction=False)
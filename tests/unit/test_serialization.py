@@ -0,0 +1,32 @@
+"""Unit tests for JSON serialization helpers."""
+
+import pytest
+
+from openhqm.utils import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_dumps_returns_compact_bytes(backend):
+    """Test values serialize to compact UTF-8 JSON."""
+    assert serialization.dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode()
+
+
+def test_round_trip(backend):
+    """Test values survive a dumps/loads round trip."""
+    value = {"status": "COMPLETED", "result": {"n": 1.5, "ok": True, "none": None}}
+
+    assert serialization.loads(serialization.dumps(value)) == value
+
+
+def test_loads_accepts_str_and_bytes(backend):
+    """Test documents can be parsed from either str or bytes."""
+    assert serialization.loads('{"a":1}') == serialization.loads(b'{"a":1}') == {"a": 1}
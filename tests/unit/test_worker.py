@@ -30,6 +30,11 @@ def mock_cache():
     cache.set = AsyncMock()
     cache.get = AsyncMock()
     cache.close = AsyncMock()
+
+    async def set_many(items, ttl=None, notify=False):
+        return await CacheInterface.set_many(cache, items, ttl, notify)
+
+    cache.set_many = AsyncMock(side_effect=set_many)
     return cache
 
 